@@ -8,6 +8,14 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from fhl_bible_mcp.server import main
-
 __all__ = ["main", "__version__"]
+
+
+def __getattr__(name: str):
+    # Import the stdio server lazily so `fhl_bible_mcp.http_server` and other
+    # entry points don't pay for its prompts/resources at startup (PEP 562).
+    if name == "main":
+        from fhl_bible_mcp.server import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,6 +11,7 @@ from typing import Any
 from urllib.parse import urlencode
 
 import httpx
+import orjson
 
 from fhl_bible_mcp.utils.errors import (
     APIResponseError,
@@ -23,6 +24,54 @@ from fhl_bible_mcp.utils.errors import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HEADERS = {
+    "User-Agent": "FHL-Bible-MCP-Server/0.1.0",
+    "Accept": "application/json, text/html",
+}
+
+# Connection pool shared by every FHLAPIClient when set (see set_shared_http_client)
+_shared_http_client: httpx.AsyncClient | None = None
+
+
+def create_http_client(timeout: float = 30) -> httpx.AsyncClient:
+    """
+    Create an httpx.AsyncClient configured for the FHL APIs.
+    
+    Args:
+        timeout: Default request timeout in seconds
+        
+    Returns:
+        A new AsyncClient with keep-alive connection pooling and HTTP/2
+        (negotiated via ALPN, falls back to HTTP/1.1)
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers=DEFAULT_HEADERS,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        http2=True,
+    )
+
+
+def set_shared_http_client(client: httpx.AsyncClient | None) -> None:
+    """
+    Install (or remove with None) the connection pool shared by all clients.
+    
+    Long-running servers create one pool at startup so tool calls reuse
+    open connections instead of paying DNS/TCP/TLS setup on every call.
+    The owner of the pool is responsible for closing it.
+    
+    Args:
+        client: Shared AsyncClient, or None to go back to per-client pools
+    """
+    global _shared_http_client
+    _shared_http_client = client
+
+
+def get_shared_http_client() -> httpx.AsyncClient | None:
+    """Return the shared connection pool, if one is installed."""
+    return _shared_http_client
+
 
 class FHLAPIClient:
     """
@@ -61,19 +110,18 @@ class FHLAPIClient:
         self.max_retries = max_retries
         self.gb = gb
         
-        # Create async HTTP client
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            follow_redirects=True,
-            headers={
-                "User-Agent": "FHL-Bible-MCP-Server/0.1.0",
-                "Accept": "application/json, text/html",
-            },
-        )
+        # Reuse the shared connection pool when available, otherwise own a client
+        shared_client = _shared_http_client
+        if shared_client is not None and not shared_client.is_closed:
+            self._client = shared_client
+            self._owns_client = False
+        else:
+            self._client = create_http_client(timeout)
+            self._owns_client = True
         
-        logger.info(
-            f"FHL API Client initialized: base_url={base_url}, "
-            f"timeout={timeout}s, max_retries={max_retries}"
+        logger.debug(
+            "FHL API Client initialized: base_url=%s, timeout=%ss, max_retries=%s",
+            base_url, timeout, max_retries,
         )
 
     async def __aenter__(self) -> "FHLAPIClient":
@@ -85,8 +133,9 @@ class FHLAPIClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP client (the shared connection pool is left open)."""
+        if self._owns_client:
+            await self._client.aclose()
         logger.debug("FHL API Client closed")
 
     async def _make_request(
@@ -121,14 +170,14 @@ class FHLAPIClient:
         url = f"{self.base_url}/{endpoint}"
         
         try:
-            logger.debug(f"Making request to {url} with params: {params}")
+            logger.debug("Making request to %s with params: %s", url, params)
             
-            response = await self._client.get(url, params=params)
+            response = await self._client.get(url, params=params, timeout=self.timeout)
             
             # Log response details
             logger.debug(
-                f"Response status: {response.status_code}, "
-                f"content-type: {response.headers.get('content-type', 'unknown')}"
+                "Response status: %s, content-type: %s",
+                response.status_code, response.headers.get("content-type", "unknown"),
             )
             
             # Handle rate limiting (if implemented by API)
@@ -149,7 +198,8 @@ class FHLAPIClient:
             
             if "application/json" in content_type:
                 try:
-                    data = response.json()
+                    # orjson parses the raw bytes directly (UTF-8, no charset sniffing)
+                    data = orjson.loads(response.content)
                     
                     # Check for API-level error status
                     if isinstance(data, dict) and data.get("status") == "error":
@@ -158,7 +208,7 @@ class FHLAPIClient:
                             status_code=response.status_code,
                         )
                     
-                    logger.debug(f"Successfully parsed JSON response")
+                    logger.debug("Successfully parsed JSON response")
                     return data
                     
                 except ValueError as e:
@@ -168,12 +218,12 @@ class FHLAPIClient:
                     )
             else:
                 # Return raw text for non-JSON responses (e.g., CSV, XML)
-                logger.debug(f"Returning raw text response")
+                logger.debug("Returning raw text response")
                 return response.text
         
         except httpx.TimeoutException as e:
             error_msg = f"Request timeout after {self.timeout}s"
-            logger.warning(f"{error_msg}: {url}")
+            logger.warning("%s: %s", error_msg, url)
             
             if retry_count < self.max_retries:
                 return await self._retry_request(endpoint, params, retry_count, error_msg)
@@ -182,7 +232,7 @@ class FHLAPIClient:
         
         except httpx.NetworkError as e:
             error_msg = f"Network error: {str(e)}"
-            logger.warning(f"{error_msg}: {url}")
+            logger.warning("%s: %s", error_msg, url)
             
             if retry_count < self.max_retries:
                 return await self._retry_request(endpoint, params, retry_count, error_msg)
@@ -198,7 +248,7 @@ class FHLAPIClient:
             raise
         
         except Exception as e:
-            logger.error(f"Unexpected error in API request: {str(e)}")
+            logger.error("Unexpected error in API request: %s", e)
             raise FHLAPIError(f"Unexpected error: {str(e)}")
 
     async def _retry_request(
@@ -224,8 +274,8 @@ class FHLAPIClient:
         wait_time = 2**retry_count  # Exponential backoff: 2, 4, 8 seconds
         
         logger.info(
-            f"Retrying request (attempt {retry_count}/{self.max_retries}) "
-            f"after {wait_time}s: {error_msg}"
+            "Retrying request (attempt %s/%s) after %ss: %s",
+            retry_count, self.max_retries, wait_time, error_msg,
         )
         
         await asyncio.sleep(wait_time)
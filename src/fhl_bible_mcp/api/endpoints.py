@@ -7,10 +7,10 @@ Each method corresponds to a specific API endpoint documented in the planning do
 
 import logging
 import hashlib
-import json
-import httpx
 from typing import Any, Optional
 
+import orjson
+
 from fhl_bible_mcp.api.client import FHLAPIClient
 from fhl_bible_mcp.config import Config, get_config
 from fhl_bible_mcp.utils.errors import InvalidParameterError
@@ -18,6 +18,70 @@ from fhl_bible_mcp.utils.cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+# Known article columns (the API has no column listing endpoint)
+ARTICLE_COLUMNS: list[dict[str, str]] = [
+    {
+        "code": "women3",
+        "name": "麻辣姊妹",
+        "description": "女性信仰生活分享"
+    },
+    {
+        "code": "sunday",
+        "name": "主日學",
+        "description": "主日學教材與資源"
+    },
+    {
+        "code": "youth",
+        "name": "青少年",
+        "description": "青少年信仰與生活"
+    },
+    {
+        "code": "family",
+        "name": "家庭",
+        "description": "家庭生活與信仰"
+    },
+    {
+        "code": "theology",
+        "name": "神學",
+        "description": "神學探討與研究"
+    },
+    {
+        "code": "bible_study",
+        "name": "查經",
+        "description": "聖經研究與分享"
+    },
+    {
+        "code": "devotion",
+        "name": "靈修",
+        "description": "靈修心得與見證"
+    },
+    {
+        "code": "mission",
+        "name": "宣教",
+        "description": "宣教事工與分享"
+    },
+    {
+        "code": "church",
+        "name": "教會",
+        "description": "教會生活與事奉"
+    },
+    {
+        "code": "culture",
+        "name": "文化",
+        "description": "信仰與文化對話"
+    },
+    {
+        "code": "history",
+        "name": "歷史",
+        "description": "教會歷史與傳統"
+    },
+    {
+        "code": "counseling",
+        "name": "輔導",
+        "description": "心理輔導與關懷"
+    }
+]
+
 
 class FHLAPIEndpoints(FHLAPIClient):
     """
@@ -70,13 +134,13 @@ class FHLAPIEndpoints(FHLAPIClient):
         self.cache = get_cache(cache_dir=_cache_dir) if _use_cache else None
         
         if self.use_cache:
-            logger.info(f"Cache enabled: {_cache_dir}")
+            logger.debug("Cache enabled: %s", _cache_dir)
             
             # 如果設定為啟動時清理,則清理過期快取
             if self.config.cache.cleanup_on_start:
                 cleanup_count = self.cache.cleanup_expired()
                 if cleanup_count > 0:
-                    logger.info(f"Cleaned up {cleanup_count} expired cache entries")
+                    logger.info("Cleaned up %s expired cache entries", cleanup_count)
     
     def _make_cache_key(self, **kwargs) -> str:
         """
@@ -89,8 +153,8 @@ class FHLAPIEndpoints(FHLAPIClient):
             Cache key string
         """
         # 將參數排序後轉成 JSON 字串
-        params_str = json.dumps(kwargs, sort_keys=True, ensure_ascii=False)
-        return hashlib.md5(params_str.encode()).hexdigest()
+        params_bytes = orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS)
+        return hashlib.md5(params_bytes).hexdigest()
     
     async def _cached_request(
         self,
@@ -120,11 +184,11 @@ class FHLAPIEndpoints(FHLAPIClient):
         # 嘗試從快取讀取
         cached_data = self.cache.get(namespace, cache_key, strategy_name=strategy)
         if cached_data is not None:
-            logger.debug(f"Cache hit: {namespace}:{cache_key[:8]}...")
+            logger.debug("Cache hit: %s:%s...", namespace, cache_key[:8])
             return cached_data
         
         # 快取未命中,發送請求
-        logger.debug(f"Cache miss: {namespace}:{cache_key[:8]}...")
+        logger.debug("Cache miss: %s:%s...", namespace, cache_key[:8])
         data = await self._make_request(endpoint, params=params)
         
         # 儲存到快取
@@ -262,7 +326,7 @@ class FHLAPIEndpoints(FHLAPIClient):
             params["sec"] = verse
         
         logger.info(
-            f"Fetching verse: {book} (bid={book_id}) {chapter}" + (f":{verse}" if verse else "")
+            "Fetching verse: %s (bid=%s) %s%s", book, book_id, chapter, f":{verse}" if verse else ""
         )
         
         return await self._cached_request(
@@ -301,7 +365,7 @@ class FHLAPIEndpoints(FHLAPIClient):
             "strong": 1 if include_strong else 0,
         }
         
-        logger.info(f"Fetching verses by citation: {citation}")
+        logger.info("Fetching verses by citation: %s", citation)
         return await self._make_request("qsb.php", params)
 
     # ========================================================================
@@ -358,7 +422,8 @@ class FHLAPIEndpoints(FHLAPIClient):
             "hebrew_number": "2",
         }
         
-        if search_type not in search_type_map:
+        orig = search_type_map.get(search_type)
+        if orig is None:
             raise InvalidParameterError(
                 "search_type",
                 search_type,
@@ -368,16 +433,17 @@ class FHLAPIEndpoints(FHLAPIClient):
         # Map scope to RANGE parameter
         scope_map = {"all": "0", "nt": "1", "ot": "2", "range": "3"}
         
-        if scope not in scope_map:
+        range_code = scope_map.get(scope)
+        if range_code is None:
             raise InvalidParameterError(
                 "scope", scope, "Must be 'all', 'ot', 'nt', or 'range'"
             )
         
         params: dict[str, Any] = {
             "VERSION": version,
-            "orig": search_type_map[search_type],
+            "orig": orig,
             "q": query,
-            "RANGE": scope_map[scope],
+            "RANGE": range_code,
             "offset": offset,
             "count_only": 1 if count_only else 0,
             "index_only": 1 if index_only else 0,
@@ -396,7 +462,7 @@ class FHLAPIEndpoints(FHLAPIClient):
             params["range_bid"] = range_start
             params["range_eid"] = range_end
         
-        logger.info(f"Searching Bible: query='{query}', type={search_type}, scope={scope}")
+        logger.info("Searching Bible: query='%s', type=%s, scope=%s", query, search_type, scope)
         return await self._cached_request(
             endpoint="se.php",
             params=params,
@@ -465,7 +531,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         
         params = {"bid": book_id, "chap": chapter, "sec": verse}
         
-        logger.info(f"Fetching word analysis: {book} (bid={book_id}) {chapter}:{verse}")
+        logger.info("Fetching word analysis: %s (bid=%s) %s:%s", book, book_id, chapter, verse)
         return await self._make_request("qp.php", params)
 
     async def get_strongs_dictionary(
@@ -512,7 +578,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         
         params = {"N": "0" if testament == "nt" else "1", "k": number}
         
-        logger.info(f"Fetching Strong's dictionary: {testament.upper()} #{number}")
+        logger.info("Fetching Strong's dictionary: %s #%s", testament.upper(), number)
         return await self._cached_request(
             endpoint="sd.php",
             params=params,
@@ -603,8 +669,8 @@ class FHLAPIEndpoints(FHLAPIClient):
             params["book"] = commentary_id
         
         logger.info(
-            f"Fetching commentary: {book} (bid={book_id}) {chapter}:{verse}"
-            + (f" (commentary #{commentary_id})" if commentary_id else "")
+            "Fetching commentary: %s (bid=%s) %s:%s%s", book, book_id, chapter, verse,
+            f" (commentary #{commentary_id})" if commentary_id else "",
         )
         return await self._make_request("sc.php", params)
 
@@ -632,7 +698,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         if commentary_id is not None:
             params["book"] = commentary_id
         
-        logger.info(f"Searching commentary: keyword='{keyword}'")
+        logger.info("Searching commentary: keyword='%s'", keyword)
         return await self._make_request("ssc.php", params)
 
     # ========================================================================
@@ -681,14 +747,15 @@ class FHLAPIEndpoints(FHLAPIClient):
             "naves_zh": "3",
         }
         
-        if source not in source_map:
+        source_code = source_map.get(source)
+        if source_code is None:
             raise InvalidParameterError(
                 "source",
                 source,
                 "Must be one of: all, torrey_en, naves_en, torrey_zh, naves_zh",
             )
         
-        params: dict[str, Any] = {"N": source_map[source], "count_only": 1 if count_only else 0}
+        params: dict[str, Any] = {"N": source_code, "count_only": 1 if count_only else 0}
         
         if keyword is not None:
             params["keyword"] = keyword
@@ -700,7 +767,7 @@ class FHLAPIEndpoints(FHLAPIClient):
                 "keyword/topic_id", None, "Either keyword or topic_id must be provided"
             )
         
-        logger.info(f"Fetching topic study: keyword='{keyword}', source={source}")
+        logger.info("Fetching topic study: keyword='%s', source=%s", keyword, source)
         return await self._make_request("st.php", params)
 
     # ========================================================================
@@ -739,7 +806,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         """
         params = {"version": audio_version, "bid": book_id, "chap": chapter}
         
-        logger.info(f"Fetching audio Bible: book_id={book_id}, chapter={chapter}")
+        logger.info("Fetching audio Bible: book_id=%s, chapter=%s", book_id, chapter)
         return await self._make_request("au.php", params)
 
     # ========================================================================
@@ -823,7 +890,7 @@ class FHLAPIEndpoints(FHLAPIClient):
             params["sec"] = verse
         
         logger.info(
-            f"Fetching apocrypha verse: {book} (bid={book_id}) {chapter}" + (f":{verse}" if verse else "")
+            "Fetching apocrypha verse: %s (bid=%s) %s%s", book, book_id, chapter, f":{verse}" if verse else ""
         )
         
         return await self._cached_request(
@@ -875,7 +942,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         if limit is not None:
             params["limit"] = limit
         
-        logger.info(f"Searching apocrypha: query='{query}'")
+        logger.info("Searching apocrypha: query='%s'", query)
         return await self._cached_request(
             endpoint="sesub.php",
             params=params,
@@ -962,7 +1029,7 @@ class FHLAPIEndpoints(FHLAPIClient):
             params["sec"] = verse
         
         logger.info(
-            f"Fetching apostolic fathers verse: {book} (bid={book_id}) {chapter}" + (f":{verse}" if verse else "")
+            "Fetching apostolic fathers verse: %s (bid=%s) %s%s", book, book_id, chapter, f":{verse}" if verse else ""
         )
         
         return await self._cached_request(
@@ -1014,7 +1081,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         if limit is not None:
             params["limit"] = limit
         
-        logger.info(f"Searching apostolic fathers: query='{query}'")
+        logger.info("Searching apostolic fathers: query='%s'", query)
         return await self._cached_request(
             endpoint="seaf.php",
             params=params,
@@ -1088,7 +1155,7 @@ class FHLAPIEndpoints(FHLAPIClient):
         }
         
         logger.info(
-            f"Fetching footnote: book_id={book_id}, footnote_id={footnote_id}, version={version}"
+            "Fetching footnote: book_id=%s, footnote_id=%s, version=%s", book_id, footnote_id, version
         )
         
         return await self._cached_request(
@@ -1208,18 +1275,17 @@ class FHLAPIEndpoints(FHLAPIClient):
             params["pubtime"] = pub_date
         
         logger.info(
-            f"Searching articles: title={title}, author={author}, "
-            f"content={content}, column={column}, limit={limit}"
+            "Searching articles: title=%s, author=%s, content=%s, column=%s, limit=%s",
+            title, author, content, column, limit,
         )
         
         # Make request to www.fhl.net/api/ (different base URL)
         # Articles API is on www.fhl.net, not bible.fhl.net
         url = "https://www.fhl.net/api/json.php"
         
-        async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+        response = await self._client.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         # Apply client-side limit
         if data.get("status") == 1 and "record" in data:
@@ -1259,68 +1325,7 @@ class FHLAPIEndpoints(FHLAPIClient):
             - May not include all columns
             - Use column codes in search_articles(column=...)
         """
-        return [
-            {
-                "code": "women3",
-                "name": "麻辣姊妹",
-                "description": "女性信仰生活分享"
-            },
-            {
-                "code": "sunday",
-                "name": "主日學",
-                "description": "主日學教材與資源"
-            },
-            {
-                "code": "youth",
-                "name": "青少年",
-                "description": "青少年信仰與生活"
-            },
-            {
-                "code": "family",
-                "name": "家庭",
-                "description": "家庭生活與信仰"
-            },
-            {
-                "code": "theology",
-                "name": "神學",
-                "description": "神學探討與研究"
-            },
-            {
-                "code": "bible_study",
-                "name": "查經",
-                "description": "聖經研究與分享"
-            },
-            {
-                "code": "devotion",
-                "name": "靈修",
-                "description": "靈修心得與見證"
-            },
-            {
-                "code": "mission",
-                "name": "宣教",
-                "description": "宣教事工與分享"
-            },
-            {
-                "code": "church",
-                "name": "教會",
-                "description": "教會生活與事奉"
-            },
-            {
-                "code": "culture",
-                "name": "文化",
-                "description": "信仰與文化對話"
-            },
-            {
-                "code": "history",
-                "name": "歷史",
-                "description": "教會歷史與傳統"
-            },
-            {
-                "code": "counseling",
-                "name": "輔導",
-                "description": "心理輔導與關懷"
-            }
-        ]
+        return ARTICLE_COLUMNS
     
     async def get_article_content(
         self,
@@ -1393,3 +1398,34 @@ class FHLAPIEndpoints(FHLAPIClient):
             "error_code": "API_LIMITATION",
             "recommendation": "Use search_articles() and cache the results"
         }
+
+
+# Endpoints instance shared by the tool functions when set (see set_shared_endpoints)
+_shared_endpoints: Optional[FHLAPIEndpoints] = None
+
+
+def set_shared_endpoints(endpoints: Optional[FHLAPIEndpoints]) -> None:
+    """
+    Install (or remove with None) the FHLAPIEndpoints shared by tool calls.
+    
+    The shared instance must be created after the shared connection pool is
+    installed (see api.client.set_shared_http_client), so that leaving an
+    ``async with`` block on it does not close anything.
+    
+    Args:
+        endpoints: Shared FHLAPIEndpoints, or None to create one per call
+    """
+    global _shared_endpoints
+    _shared_endpoints = endpoints
+
+
+def get_endpoints() -> FHLAPIEndpoints:
+    """
+    Return the shared FHLAPIEndpoints, or a new instance if none is installed.
+    
+    Use as ``async with get_endpoints() as api:``. Reusing the shared
+    instance skips the per-call config lookup, cache setup and client setup.
+    """
+    if _shared_endpoints is not None:
+        return _shared_endpoints
+    return FHLAPIEndpoints()
@@ -9,15 +9,28 @@ https://smithery.ai/docs/migrations/python-custom-container
 """
 
 import os
+import sys
+import asyncio
+import atexit
+import queue
+import inspect
 import logging
-import json
+import functools
+from dataclasses import dataclass
+from contextvars import ContextVar
+from typing import Optional
 import base64
-import uvicorn
+import orjson
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import parse_qs
+from mcp import types
 from mcp.server.fastmcp import FastMCP
-from starlette.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, Field
 from starlette.applications import Starlette
-from starlette.routing import Route, Mount
-from starlette.responses import JSONResponse, Response
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Route
+from starlette.responses import Response
 
 # Import tool functions with aliases to avoid conflict with FastMCP decorated functions
 from fhl_bible_mcp.tools.verse import (
@@ -27,15 +40,12 @@ from fhl_bible_mcp.tools.verse import (
 )
 from fhl_bible_mcp.tools.search import (
     search_bible as search_bible_func,
-    search_bible_advanced as search_bible_advanced_func,
 )
 from fhl_bible_mcp.tools.strongs import (
     get_word_analysis as get_word_analysis_func,
     lookup_strongs as lookup_strongs_func,
-    search_strongs_occurrences as search_strongs_occurrences_func,
 )
 from fhl_bible_mcp.tools.commentary import (
-    get_commentary as get_commentary_func,
     list_commentaries as list_commentaries_func,
     search_commentary as search_commentary_func,
     get_topic_study as get_topic_study_func,
@@ -51,6 +61,9 @@ from fhl_bible_mcp.tools.audio import (
 
 # Import HTTP-adapted tool wrappers for tools that need signature adaptation
 from fhl_bible_mcp.http_tools import (
+    http_search_bible_advanced,
+    http_search_strongs_occurrences,
+    http_get_commentary,
     http_get_book_list,
     http_get_book_info,
     http_get_audio_bible,
@@ -64,19 +77,135 @@ from fhl_bible_mcp.http_tools import (
     http_search_articles,
     http_list_article_columns,
 )
+from fhl_bible_mcp.api.client import create_http_client, set_shared_http_client
+from fhl_bible_mcp.api.endpoints import FHLAPIEndpoints, set_shared_endpoints
+from fhl_bible_mcp.utils.cache import list_cached, lookup_cached, single_flight
+from fhl_bible_mcp.utils.serialization import to_compact_json
 from mcp.server.transport_security import TransportSecuritySettings
 
+try:
+    from smithery.utils.config import parse_config_from_asgi_scope as _parse_smithery_config
+except ImportError:  # older smithery releases do not ship the config helpers
+    _parse_smithery_config = None
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+def _configure_logging() -> None:
+    """
+    Send log records through a queue so handlers never block the event loop.
+
+    The request path only enqueues the record; a QueueListener thread does the
+    formatting and the (blocking) stream write. Like logging.basicConfig, this
+    does nothing if the root logger already has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+_configure_logging()
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# In-process Tool Result Cache
+# ============================================================================
+
+# Bible text, Strong's entries, footnotes and book/version metadata do not
+# change, so identical calls are answered from memory: the serialized JSON text
+# is cached per tool, keyed on the call arguments, which skips both the
+# upstream round-trip and re-encoding. Argument-free list tools get a longer TTL
+# (lookup_cached / list_cached in utils.cache, shared with the other servers).
+
+# Tool name -> cache decorator applied by _make_tool (read-only tools only)
+_TOOL_CACHES = {
+    "get_bible_verse": lookup_cached,
+    "get_bible_chapter": lookup_cached,
+    "query_verse_citation": lookup_cached,
+    "get_word_analysis": lookup_cached,
+    "lookup_strongs": lookup_cached,
+    "get_book_info": lookup_cached,
+    "get_bible_footnote": lookup_cached,
+    "get_apocrypha_verse": lookup_cached,
+    "get_apostolic_fathers_verse": lookup_cached,
+    "list_commentaries": list_cached,
+    "list_bible_versions": list_cached,
+    "search_available_versions": list_cached,
+    "get_book_list": list_cached,
+    "list_audio_versions": list_cached,
+    "list_apocrypha_books": list_cached,
+    "list_apostolic_fathers_books": list_cached,
+    "list_fhl_article_columns": list_cached,
+}
+
+
+@dataclass(frozen=True)
+class HTTPSettings:
+    """
+    Deployment settings, resolved once from the environment at import.
+
+    - transport: "http" (default) or "stdio" (TRANSPORT)
+    - port: HTTP port, Smithery sets PORT (default 8081)
+    - workers: uvicorn worker processes (WORKERS, default 1). MCP sessions
+      live in process memory, so with more than one worker the server runs
+      in stateless mode and any worker can answer any request.
+    - log_level: uvicorn log level (UVICORN_LOG_LEVEL, default "info");
+      "warning" keeps uvicorn's own per-connection messages off the hot path
+    - json_response: answer MCP requests with plain JSON instead of an SSE
+      stream (MCP_JSON_RESPONSE, default off); only JSON responses are gzipped
+    - limit_concurrency: open connections (including idle keep-alive and
+      long-lived SSE streams) above which uvicorn answers 503
+      (UVICORN_LIMIT_CONCURRENCY, default 1000, 0 = unlimited)
+    - backlog: TCP listen backlog (UVICORN_BACKLOG, default 2048)
+    - timeout_keep_alive: seconds an idle keep-alive connection stays open
+      (UVICORN_TIMEOUT_KEEP_ALIVE, default 30; uvicorn's own default is 5)
+    - limit_max_requests: requests after which a worker is recycled, only
+      with more than one worker (UVICORN_LIMIT_MAX_REQUESTS, default 10000,
+      0 = never)
+    """
+    transport: str = "http"
+    port: int = 8081
+    workers: int = 1
+    log_level: str = "info"
+    json_response: bool = False
+    limit_concurrency: int = 1000
+    backlog: int = 2048
+    timeout_keep_alive: int = 30
+    limit_max_requests: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "HTTPSettings":
+        return cls(
+            transport=os.getenv("TRANSPORT", "http"),
+            port=int(os.getenv("PORT", "8081")),
+            workers=max(1, int(os.getenv("WORKERS", "1"))),
+            log_level=os.getenv("UVICORN_LOG_LEVEL", "info").lower(),
+            json_response=os.getenv("MCP_JSON_RESPONSE", "").lower() in ("true", "1", "yes", "on"),
+            limit_concurrency=max(0, int(os.getenv("UVICORN_LIMIT_CONCURRENCY", "1000"))),
+            backlog=max(1, int(os.getenv("UVICORN_BACKLOG", "2048"))),
+            timeout_keep_alive=max(1, int(os.getenv("UVICORN_TIMEOUT_KEEP_ALIVE", "30"))),
+            limit_max_requests=max(0, int(os.getenv("UVICORN_LIMIT_MAX_REQUESTS", "10000"))),
+        )
+
+
+SETTINGS = HTTPSettings.from_env()
+
 # Initialize FastMCP server with transport security configured for external hosting
 # This allows requests from Render.com and other external hosts
 mcp = FastMCP(
     name="FHL Bible MCP Server",
+    stateless_http=SETTINGS.workers > 1,
+    json_response=SETTINGS.json_response,
     transport_security=TransportSecuritySettings(
         # Disable DNS rebinding protection for cloud deployment
         # This is safe because we're behind Render's proxy/load balancer
@@ -126,741 +255,670 @@ MCP_CONFIG = {
 }
 
 
+# The well-known documents and the health payload are constant, so serialize
+# them once at import time
+_MCP_CONFIG_BODY = orjson.dumps(MCP_CONFIG)
+_SERVER_CARD_BODY = orjson.dumps(SERVER_CARD)
+_HEALTH_BODY = orjson.dumps({"status": "ok", "server": "FHL Bible MCP Server"})
+
+
 async def well_known_mcp_config(request):
     """Handle /.well-known/mcp-config endpoint for Smithery."""
-    return JSONResponse(MCP_CONFIG)
+    return Response(_MCP_CONFIG_BODY, media_type="application/json")
 
 
 async def well_known_server_card(request):
     """Handle /.well-known/mcp/server-card.json endpoint for Smithery."""
-    return JSONResponse(SERVER_CARD)
+    return Response(_SERVER_CARD_BODY, media_type="application/json")
 
 
 async def health_check(request):
-    """Health check endpoint."""
-    return JSONResponse({"status": "ok", "server": "FHL Bible MCP Server"})
+    """Health check endpoint (GET, and HEAD for load balancer probes)."""
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 # ============================================================================
 # Smithery Config Middleware
 # ============================================================================
 
-class SmitheryConfigMiddleware:
-    """
-    Middleware for extracting Smithery session configuration from URL parameters.
-    Parses JSON dot-notation query parameters (e.g., use_simplified=true).
-    Based on official Smithery cookbook example.
-    """
-    
-    def __init__(self, app):
-        self.app = app
-    
-    async def __call__(self, scope, receive, send):
-        if scope.get('type') == 'http':
-            from urllib.parse import parse_qs
-            try:
-                query_string = scope.get('query_string', b'').decode('utf-8')
-                params = parse_qs(query_string)
-                
-                # Convert single-value lists to values and parse booleans
-                config = {}
-                for k, v in params.items():
-                    value = v[0] if len(v) == 1 else v
-                    # Parse boolean strings
-                    if isinstance(value, str):
-                        if value.lower() == 'true':
-                            value = True
-                        elif value.lower() == 'false':
-                            value = False
-                    config[k] = value
-                
-                scope['smithery_config'] = config
-            except Exception as e:
-                logger.warning(f"SmitheryConfigMiddleware: Error parsing config: {e}")
-                scope['smithery_config'] = {}
-        
-        await self.app(scope, receive, send)
-
-
-# ============================================================================
-# Configuration Helpers
-# ============================================================================
-
-def get_request_config() -> dict:
-    """Get full config from current request context."""
-    try:
-        import contextvars
-        request = contextvars.copy_context().get('request')
-        if hasattr(request, 'scope') and request.scope:
-            return request.scope.get('smithery_config', {})
-    except Exception:
-        pass
-    return {}
+def _parse_query_config(scope) -> dict:
+    """Parse query parameters into a config dict (fallback when Smithery's parser is unavailable)."""
+    query_string = scope.get('query_string', b'').decode('utf-8')
+    params = parse_qs(query_string)
 
+    # Convert single-value lists to values and parse booleans
+    config = {}
+    for k, v in params.items():
+        value = v[0] if len(v) == 1 else v
+        # Parse boolean strings
+        if isinstance(value, str):
+            if value.lower() == 'true':
+                value = True
+            elif value.lower() == 'false':
+                value = False
+        config[k] = value
+    return config
 
-def get_config_value(key: str, default=None):
-    """Get a specific config value from current request."""
-    config = get_request_config()
-    return config.get(key, default)
 
+# Resolve the config parser once at import time instead of on every request
+_parse_config = _parse_smithery_config or _parse_query_config
 
-# ============================================================================
-# Verse Query Tools
-# ============================================================================
 
-@mcp.tool()
-async def get_bible_verse(
-    book: str,
-    chapter: int,
-    verse: str = None,
-    version: str = "unv",
-    include_strong: bool = False,
-    use_simplified: bool = False
-) -> str:
-    """查詢指定的聖經經文。支援單節、多節、節範圍查詢。
-    
-    Args:
-        book: 經卷名稱（中文或英文縮寫，如：約、John、創世記、Genesis）
-        chapter: 章數
-        verse: 節數（支援格式：'1', '1-5', '1,3,5', '1-2,5,8-10'）。若不提供則返回整章
-        version: 聖經版本代碼（預設：unv）
-        include_strong: 是否包含 Strong's Number（預設：false）
-        use_simplified: 是否使用簡體中文（預設：false）
+@lru_cache(maxsize=1024)
+def _parse_config_cached(query_string: bytes) -> tuple:
     """
-    result = await get_bible_verse_func(
-        book=book,
-        chapter=chapter,
-        verse=verse,
-        version=version,
-        include_strong=include_strong,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    Parse and memoize the config for a raw query string.
 
-
-@mcp.tool()
-async def get_bible_chapter(
-    book: str,
-    chapter: int,
-    version: str = "unv",
-    use_simplified: bool = False
-) -> str:
-    """查詢整章聖經經文。
-    
-    Args:
-        book: 經卷名稱
-        chapter: 章數
-        version: 聖經版本代碼（預設：unv）
-        use_simplified: 是否使用簡體中文
+    MCP clients reuse the same URL for a whole session, so the same query
+    string is parsed over and over. Items are returned as a tuple so the
+    cached value cannot be mutated; callers build a fresh dict from it.
     """
-    result = await get_bible_chapter_func(
-        book=book,
-        chapter=chapter,
-        version=version,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return tuple(_parse_config({'query_string': query_string}).items())
 
 
-@mcp.tool()
-async def query_verse_citation(
-    citation: str,
-    version: str = "unv",
-    include_strong: bool = False,
-    use_simplified: bool = False
-) -> str:
-    """解析並查詢經文引用字串（如：'約 3:16', '太 5:3-10'）。
-    
-    Args:
-        citation: 經文引用字串
-        version: 聖經版本代碼
-        include_strong: 是否包含 Strong's Number
-        use_simplified: 是否使用簡體中文
-    """
-    result = await query_verse_citation_func(
-        citation=citation,
-        version=version,
-        include_strong=include_strong,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
+# Smithery config of the request being handled (set by smithery_config_middleware)
+_request_config: ContextVar[Optional[dict]] = ContextVar("smithery_config", default=None)
 
-# ============================================================================
-# Search Tools
-# ============================================================================
 
-@mcp.tool()
-async def search_bible(
-    query: str,
-    search_type: str = "keyword",
-    scope: str = "all",
-    version: str = "unv",
-    limit: int = 50,
-    use_simplified: bool = False
-) -> str:
-    """在聖經中搜尋關鍵字或原文編號。
-    
-    Args:
-        query: 搜尋內容
-        search_type: 搜尋類型（keyword=關鍵字, greek_number=希臘文編號, hebrew_number=希伯來文編號）
-        scope: 搜尋範圍（all=全部, ot=舊約, nt=新約）
-        version: 聖經版本代碼
-        limit: 最多返回筆數
-        use_simplified: 是否使用簡體中文
+def smithery_config_middleware(app):
     """
-    result = await search_bible_func(
-        query=query,
-        search_type=search_type,
-        scope=scope,
-        version=version,
-        limit=limit,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def search_bible_advanced(
-    query: str,
-    search_type: str = "keyword",
-    range_start: int = None,
-    range_end: int = None,
-    version: str = "unv",
-    limit: int = 50,
-    offset: int = 0,
-    use_simplified: bool = False
-) -> str:
-    """進階聖經搜尋，支援自訂書卷範圍。
-    
-    Args:
-        query: 搜尋內容
-        search_type: 搜尋類型（keyword/greek_number/hebrew_number）
-        range_start: 起始書卷編號 (1-66)
-        range_end: 結束書卷編號 (1-66)
-        version: 聖經版本代碼
-        limit: 最多返回筆數
-        offset: 跳過筆數
-        use_simplified: 是否使用簡體中文
+    Pure ASGI middleware for extracting Smithery session configuration from URL parameters.
+    Parses JSON dot-notation query parameters (e.g., use_simplified=true).
+    Based on official Smithery cookbook example.
     """
-    result = await search_bible_advanced_func(
-        query=query,
-        search_type=search_type,
-        range_start=range_start,
-        range_end=range_end,
-        version=version,
-        limit=limit,
-        offset=offset,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
+    async def middleware(scope, receive, send):
+        if scope['type'] != 'http':
+            await app(scope, receive, send)
+            return
 
-# ============================================================================
-# Strong's Tools
-# ============================================================================
-
-@mcp.tool()
-async def get_word_analysis(
-    book: str,
-    chapter: int,
-    verse: int,
-    use_simplified: bool = False
-) -> str:
-    """取得經文的原文字彙分析（希臘文/希伯來文）。
-    
-    Args:
-        book: 經卷名稱
-        chapter: 章數
-        verse: 節數
-        use_simplified: 是否使用簡體中文
-    """
-    result = await get_word_analysis_func(
-        book=book,
-        chapter=chapter,
-        verse=verse,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+        try:
+            config = dict(_parse_config_cached(scope.get('query_string', b'')))
+        except ValueError as e:
+            logger.warning("smithery_config_middleware: Error parsing config: %s", e)
+            config = {}
 
+        scope['smithery_config'] = config
+        token = _request_config.set(config)
+        try:
+            await app(scope, receive, send)
+        finally:
+            _request_config.reset(token)
 
-@mcp.tool()
-async def lookup_strongs(
-    number: str,
-    testament: str = None,
-    use_simplified: bool = False
-) -> str:
-    """查詢 Strong's 原文字典。支援多種格式：整數+testament (3056, 'NT')、G前綴 ('G3056')、H前綴 ('H430')。
-    
-    Args:
-        number: Strong's Number (整數、字串數字、或帶 G/H 前綴，如 'G3056' 或 'H430')
-        testament: 約別（OT=舊約, NT=新約）。當 number 包含 G/H 前綴時可省略。
-        use_simplified: 是否使用簡體中文
-    """
-    result = await lookup_strongs_func(
-        number=number,
-        testament=testament,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def search_strongs_occurrences(
-    number: str,
-    testament: str = None,
-    limit: int = 50,
-    use_simplified: bool = False
-) -> str:
-    """搜尋 Strong's Number 在聖經中的出現位置。
-    
-    Args:
-        number: Strong's Number（如 'G1344' 或 'H430'）
-        testament: 約別（當 number 包含 G/H 前綴時可省略）
-        limit: 最多返回筆數
-        use_simplified: 是否使用簡體中文
-    """
-    result = await search_strongs_occurrences_func(
-        number=number,
-        testament=testament,
-        limit=limit,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    return middleware
 
 
 # ============================================================================
-# Commentary Tools
+# Configuration Helpers
 # ============================================================================
 
-@mcp.tool()
-async def get_commentary(
-    book: str,
-    chapter: int,
-    verse: int = None,
-    use_simplified: bool = False
-) -> str:
-    """查詢經文註釋。
-    
-    Args:
-        book: 書卷名稱
-        chapter: 章數
-        verse: 節數（可選）
-        use_simplified: 是否使用簡體中文
-    """
-    result = await get_commentary_func(
-        book=book,
-        chapter=chapter,
-        verse=verse,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def list_commentaries(
-    use_simplified: bool = False
-) -> str:
-    """列出所有可用的註釋書。
-    
-    Args:
-        use_simplified: 是否使用簡體中文
-    """
-    result = await list_commentaries_func(use_simplified=use_simplified)
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def search_commentary(
-    keyword: str,
-    use_simplified: bool = False
-) -> str:
-    """在註釋書中搜尋關鍵字。
-    
-    Args:
-        keyword: 搜尋關鍵字
-        use_simplified: 是否使用簡體中文
-    """
-    result = await search_commentary_func(
-        keyword=keyword,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+def get_request_config() -> dict:
+    """Get full config from current request context."""
+    return _request_config.get() or {}
 
 
-@mcp.tool()
-async def get_topic_study(
-    keyword: str,
-    source: str = "all",
-    count_only: bool = False,
-    use_simplified: bool = False
-) -> str:
-    """查詢主題查經資料（Torrey, Naves）。
-    
-    Args:
-        keyword: 主題關鍵字
-        source: 資料來源（all/torrey_en/naves_en/torrey_zh/naves_zh）
-        count_only: 是否只返回總數
-        use_simplified: 是否使用簡體中文
-    """
-    result = await get_topic_study_func(
-        keyword=keyword,
-        source=source,
-        count_only=count_only,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+def get_config_value(key: str, default=None):
+    """Get a specific config value from current request."""
+    config = _request_config.get()
+    if config is None:
+        return default
+    return config.get(key, default)
 
 
 # ============================================================================
-# Info Tools
+# MCP Tools
 # ============================================================================
 
-@mcp.tool()
-async def list_bible_versions(
-    use_simplified: bool = False
-) -> str:
-    """列出所有可用的聖經版本。
-    
-    Args:
-        use_simplified: 是否使用簡體中文
-    """
-    result = await list_bible_versions_func(use_simplified=use_simplified)
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def search_available_versions(
-    testament: str = None,
-    has_strongs: bool = None,
-    use_simplified: bool = False
-) -> str:
-    """搜尋符合條件的聖經版本。
-    
-    Args:
-        testament: 約別（OT/NT/both）
-        has_strongs: 是否包含 Strong's Number
-        use_simplified: 是否使用簡體中文
-    """
-    result = await search_available_versions_func(
-        testament=testament,
-        has_strongs=has_strongs,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def get_book_list(
-    testament: str = "all",
-) -> str:
-    """取得聖經書卷列表。
-    
-    Args:
-        testament: 約別（all/OT/NT）
+def _make_tool(name: str, fn, cache=None):
     """
-    result = await http_get_book_list(
-        testament=testament,
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def get_book_info(
-    book: str,
-) -> str:
-    """取得特定書卷的詳細資訊。
-    
-    Args:
-        book: 書卷名稱
+    Build the FastMCP tool for an implementation function.
+
+    The tool keeps the implementation's parameters (FastMCP builds the input
+    schema from them) and returns the result serialized as JSON text. When a
+    cache decorator is given, the serialized text is what gets cached.
+    Identical calls that arrive while one is in flight share its result.
+    Synchronous implementations run in the default thread pool so blocking
+    I/O never stalls the event loop.
     """
-    result = await http_get_book_info(
-        book=book,
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    if inspect.iscoroutinefunction(fn):
+        run = fn
+    else:
+        async def run(**kwargs):
+            return await asyncio.to_thread(fn, **kwargs)
+
+    @single_flight
+    async def call(**kwargs) -> str:
+        return to_compact_json(await run(**kwargs))
+
+    if cache is not None:
+        call = cache(call)
+
+    # The outermost wrapper is the tool itself (no extra forwarding call);
+    # it takes the implementation's metadata and parameters
+    tool = functools.update_wrapper(call, fn)
+    tool.__name__ = name
+    tool.__signature__ = inspect.signature(fn).replace(return_annotation=str)
+    return tool
+
+
+# (tool name, implementation, description) - registered in this order
+TOOLS = [
+    # Verse Query Tools
+    (
+        "get_bible_verse",
+        get_bible_verse_func,
+        """
+        查詢指定的聖經經文。支援單節、多節、節範圍查詢。
+
+        Args:
+            book: 經卷名稱（中文或英文縮寫，如：約、John、創世記、Genesis）
+            chapter: 章數
+            verse: 節數（支援格式：'1', '1-5', '1,3,5', '1-2,5,8-10'）。若不提供則返回整章
+            version: 聖經版本代碼（預設：unv）
+            include_strong: 是否包含 Strong's Number（預設：false）
+            use_simplified: 是否使用簡體中文（預設：false）
+        """,
+    ),
+    (
+        "get_bible_chapter",
+        get_bible_chapter_func,
+        """
+        查詢整章聖經經文。
+
+        Args:
+            book: 經卷名稱
+            chapter: 章數
+            version: 聖經版本代碼（預設：unv）
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "query_verse_citation",
+        query_verse_citation_func,
+        """
+        解析並查詢經文引用字串（如：'約 3:16', '太 5:3-10'）。
+
+        Args:
+            citation: 經文引用字串
+            version: 聖經版本代碼
+            include_strong: 是否包含 Strong's Number
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    # Search Tools
+    (
+        "search_bible",
+        search_bible_func,
+        """
+        在聖經中搜尋關鍵字或原文編號。
+
+        Args:
+            query: 搜尋內容
+            search_type: 搜尋類型（keyword=關鍵字, greek_number=希臘文編號, hebrew_number=希伯來文編號）
+            scope: 搜尋範圍（all=全部, ot=舊約, nt=新約）
+            version: 聖經版本代碼
+            limit: 最多返回筆數
+            offset: 跳過筆數（用於分頁，預設：0）
+            use_simplified: 是否使用簡體中文
+            count_only: 是否只返回結果筆數（預設：false）
+        """,
+    ),
+    (
+        "search_bible_advanced",
+        http_search_bible_advanced,
+        """
+        進階聖經搜尋，支援自訂書卷範圍。
+
+        Args:
+            query: 搜尋內容
+            search_type: 搜尋類型（keyword/greek_number/hebrew_number）
+            range_start: 起始書卷編號 (1-66)
+            range_end: 結束書卷編號 (1-66)
+            version: 聖經版本代碼
+            limit: 最多返回筆數
+            offset: 跳過筆數
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    # Strong's Tools
+    (
+        "get_word_analysis",
+        get_word_analysis_func,
+        """
+        取得經文的原文字彙分析（希臘文/希伯來文）。
+
+        Args:
+            book: 經卷名稱
+            chapter: 章數
+            verse: 節數
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "lookup_strongs",
+        lookup_strongs_func,
+        """
+        查詢 Strong's 原文字典。支援多種格式：整數+testament (3056, 'NT')、G前綴 ('G3056')、H前綴 ('H430')。
+
+        Args:
+            number: Strong's Number (整數、字串數字、或帶 G/H 前綴，如 'G3056' 或 'H430')
+            testament: 約別（OT=舊約, NT=新約）。當 number 包含 G/H 前綴時可省略。
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "search_strongs_occurrences",
+        http_search_strongs_occurrences,
+        """
+        搜尋 Strong's Number 在聖經中的出現位置。
+
+        Args:
+            number: Strong's Number（如 'G1344' 或 'H430'）
+            testament: 約別（當 number 包含 G/H 前綴時可省略）
+            limit: 最多返回筆數
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    # Commentary Tools
+    (
+        "get_commentary",
+        http_get_commentary,
+        """
+        查詢經文註釋。
+
+        Args:
+            book: 書卷名稱
+            chapter: 章數
+            verse: 節數（可選）
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "list_commentaries",
+        list_commentaries_func,
+        """
+        列出所有可用的註釋書。
+
+        Args:
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "search_commentary",
+        search_commentary_func,
+        """
+        在註釋書中搜尋關鍵字。
+
+        Args:
+            keyword: 搜尋關鍵字
+            commentary_id: 註釋書編號（可選，不指定則搜尋所有註釋書）
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "get_topic_study",
+        get_topic_study_func,
+        """
+        查詢主題查經資料（Torrey, Naves）。
+
+        Args:
+            keyword: 主題關鍵字
+            source: 資料來源（all/torrey_en/naves_en/torrey_zh/naves_zh）
+            count_only: 是否只返回總數
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    # Info Tools
+    (
+        "list_bible_versions",
+        list_bible_versions_func,
+        """
+        列出所有可用的聖經版本。
+
+        Args:
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "search_available_versions",
+        search_available_versions_func,
+        """
+        搜尋符合條件的聖經版本。
+
+        Args:
+            testament: 約別（OT/NT/both）
+            has_strongs: 是否包含 Strong's Number
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "get_book_list",
+        http_get_book_list,
+        """
+        取得聖經書卷列表。
+
+        Args:
+            testament: 約別（all/OT/NT）
+        """,
+    ),
+    (
+        "get_book_info",
+        http_get_book_info,
+        """
+        取得特定書卷的詳細資訊。
+
+        Args:
+            book: 書卷名稱
+        """,
+    ),
+    # Audio Tools
+    (
+        "get_audio_bible",
+        http_get_audio_bible,
+        """
+        取得有聲聖經連結。
+
+        Args:
+            book: 書卷名稱
+            chapter: 章數
+            audio_version: 有聲聖經版本代碼（預設 unv 和合本）
+                可用版本：unv, taiwanese, hakka, cantonese, tcv, hebrew, greek 等
+        """,
+    ),
+    (
+        "get_audio_chapter_with_text",
+        get_audio_chapter_with_text_func,
+        """
+        取得整章有聲聖經連結與經文。
+
+        Args:
+            book: 書卷名稱
+            chapter: 章數
+            audio_version: 有聲聖經版本代碼（預設 unv 和合本）
+            text_version: 經文版本代碼（預設 unv 和合本）
+            use_simplified: 是否使用簡體中文
+        """,
+    ),
+    (
+        "list_audio_versions",
+        list_audio_versions_func,
+        """
+        列出所有可用的有聲聖經版本。
+        """,
+    ),
+    # Apocrypha Tools
+    (
+        "get_apocrypha_verse",
+        http_get_apocrypha_verse,
+        """
+        查詢次經 (Apocrypha) 經文內容。支援書卷 101-115。
+        包含：多俾亞傳、友弟德傳、瑪加伯上下、智慧篇、德訓篇(便西拉智訓)、巴錄書等。
+
+        Args:
+            book: 次經書卷名稱（支援多種格式）。
+                  中文縮寫：'多', '友', '加上', '加下', '智', '德', '巴', '耶信', '但補'
+                  中文全名：'多俾亞傳', '友弟德傳', '瑪加伯上', '瑪加伯下', '智慧篇', '德訓篇', '便西拉智訓', '巴錄書' 等
+                  英文：'Tob', 'Jdt', '1Mac', '2Mac', 'Wis', 'Sir', 'Bar', 'Tobit', 'Judith', 'Sirach' 等
+            chapter: 章數
+            verse: 節數（可選）。支援多種格式：
+                  - 單節：'1'
+                  - 範圍：'1-5'
+                  - 多節：'1,3,5'
+                  - 混合：'1-2,5,8-10'
+                  若不提供則返回整章
+        """,
+    ),
+    (
+        "search_apocrypha",
+        http_search_apocrypha,
+        """
+        在次經中搜尋關鍵字。
+
+        Args:
+            query: 搜尋關鍵字
+            limit: 返回結果數量上限
+            offset: 跳過的結果數量（用於分頁）
+        """,
+    ),
+    (
+        "list_apocrypha_books",
+        http_list_apocrypha_books,
+        """
+        列出所有可用的次經書卷及其資訊。
+        """,
+    ),
+    # Apostolic Fathers Tools
+    (
+        "get_apostolic_fathers_verse",
+        http_get_apostolic_fathers_verse,
+        """
+        查詢使徒教父文獻經文內容。
+
+        Args:
+            book: 使徒教父書卷名稱
+            chapter: 章數
+            verse: 節數（可選）
+        """,
+    ),
+    (
+        "search_apostolic_fathers",
+        http_search_apostolic_fathers,
+        """
+        在使徒教父文獻中搜尋關鍵字。
+
+        Args:
+            query: 搜尋關鍵字
+            limit: 返回結果數量上限
+            offset: 跳過的結果數量（用於分頁）
+        """,
+    ),
+    (
+        "list_apostolic_fathers_books",
+        http_list_apostolic_fathers_books,
+        """
+        列出所有可用的使徒教父書卷及其資訊。
+        """,
+    ),
+    # Footnotes Tools
+    (
+        "get_bible_footnote",
+        http_get_bible_footnote,
+        """
+        查詢聖經經文註腳（僅限 TCV 現代中文譯本）。
+        註腳提供原文翻譯的不同選擇、古卷差異說明、或其他重要補充資訊。
+
+        **重要提示**: 僅台灣聖經公會現代中文譯本 (TCV) 有註腳功能。
+
+        Args:
+            book_id: 書卷編號 (1-66)。例如：1=創世記, 19=詩篇, 43=約翰福音, 45=羅馬書
+            footnote_id: 註腳編號（每個書卷有自己的編號系統）。從 1 開始遞增。若編號不存在，會返回空結果。
+            use_simplified: 是否使用簡體中文（預設：否）
+        """,
+    ),
+    # Articles Tools
+    (
+        "search_fhl_articles",
+        http_search_articles,
+        """
+        搜尋信望愛站的文章。
+
+        可以依據標題、作者、內容、摘要、專欄、發表日期等條件搜尋。
+        **至少需要提供一個搜尋條件**。
+
+        **回傳內容**：
+        - 預設模式 (include_content=false): 返回摘要和內容預覽（約 200 字）
+        - 完整模式 (include_content=true): 返回完整 HTML 內容
+
+        回傳文章列表，包含：
+        - 標題 (title)
+        - 作者 (author)
+        - 發表日期 (pubtime)
+        - 專欄 (column)
+        - 摘要 (abst)
+        - 內容預覽 (content_preview) 或完整內容 (content, HTML 格式)
+
+        ⚠️ **注意**: FHL API 不支援通過 ID 直接獲取文章，因此若需要完整內容，
+        請在搜尋時設定 include_content=true。
+
+        Args:
+            title: 標題關鍵字
+            author: 作者名稱
+            content: 內文關鍵字
+            abstract: 摘要關鍵字
+            column: 專欄英文代碼（如 women3）。使用 list_fhl_article_columns 工具查看可用專欄
+            pub_date: 發表日期，格式為 YYYY.MM.DD（如 2025.10.19）
+            limit: 最多回傳結果數（預設：50，範圍：1-200）
+            include_content: 是否包含完整 HTML 內容（預設：false，只返回預覽）。設為 true 會返回完整文章內容，但輸出較大。
+            use_simplified: 是否使用簡體中文（預設：false，使用繁體）
+        """,
+    ),
+    (
+        "list_fhl_article_columns",
+        http_list_article_columns,
+        """
+        列出信望愛站可用的文章專欄。
+
+        回傳所有可搜尋的專欄，包含：
+        - 專欄代碼 (code): 用於 search_fhl_articles 的 column 參數
+        - 專欄名稱 (name): 中文名稱
+        - 專欄說明 (description): 專欄內容簡介
+
+        使用專欄代碼可以精確搜尋特定專欄的文章。
+
+        範例：
+        - 查看所有專欄：list_fhl_article_columns()
+        - 然後使用代碼搜尋：search_fhl_articles(column="women3")
+        """,
+    ),
+]
+
+
+# Registered FastMCP tools by name (used by the batch tool)
+_BATCH_TOOLS = {}
+
+# Tools return JSON text; structured_output=False keeps FastMCP from also
+# copying that text into structuredContent (the payload would be sent twice)
+for _name, _fn, _description in TOOLS:
+    mcp.tool(
+        name=_name,
+        description=inspect.cleandoc(_description),
+        structured_output=False,
+    )(_make_tool(_name, _fn, cache=_TOOL_CACHES.get(_name)))
+    _BATCH_TOOLS[_name] = mcp._tool_manager.get_tool(_name)
 
 
 # ============================================================================
-# Audio Tools
+# Batch Tool
 # ============================================================================
 
-@mcp.tool()
-async def get_audio_bible(
-    book: str,
-    chapter: int,
-    audio_version: str = "unv"
-) -> str:
-    """取得有聲聖經連結。
-    
-    Args:
-        book: 書卷名稱
-        chapter: 章數
-        audio_version: 有聲聖經版本代碼（預設 unv 和合本）
-            可用版本：unv, taiwanese, hakka, cantonese, tcv, hebrew, greek 等
-    """
-    result = await http_get_audio_bible(
-        book=book,
-        chapter=chapter,
-        audio_version=audio_version
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def get_audio_chapter_with_text(
-    book: str,
-    chapter: int,
-    audio_version: str = "unv",
-    text_version: str = "unv",
-    use_simplified: bool = False
-) -> str:
-    """取得整章有聲聖經連結與經文。
-    
-    Args:
-        book: 書卷名稱
-        chapter: 章數
-        audio_version: 有聲聖經版本代碼（預設 unv 和合本）
-        text_version: 經文版本代碼（預設 unv 和合本）
-        use_simplified: 是否使用簡體中文
-    """
-    result = await get_audio_chapter_with_text_func(
-        book=book,
-        chapter=chapter,
-        audio_version=audio_version,
-        text_version=text_version,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
+BATCH_MAX_CALLS = 50
 
-@mcp.tool()
-async def list_audio_versions() -> str:
-    """列出所有可用的有聲聖經版本。"""
-    result = await list_audio_versions_func()
-    return json.dumps(result, ensure_ascii=False, indent=2)
 
+class BatchCall(BaseModel):
+    """One tool call inside a batch request."""
+    name: str = Field(description="工具名稱（如 lookup_strongs）")
+    arguments: dict = Field(default_factory=dict, description="工具參數")
 
-# ============================================================================
-# Apocrypha Tools
-# ============================================================================
 
-@mcp.tool()
-async def get_apocrypha_verse(
-    book: str,
-    chapter: int,
-    verse: str = None
-) -> str:
-    """查詢次經 (Apocrypha) 經文內容。支援書卷 101-115。
-    包含：多俾亞傳、友弟德傳、瑪加伯上下、智慧篇、德訓篇(便西拉智訓)、巴錄書等。
-    
-    Args:
-        book: 次經書卷名稱（支援多種格式）。
-              中文縮寫：'多', '友', '加上', '加下', '智', '德', '巴', '耶信', '但補'
-              中文全名：'多俾亞傳', '友弟德傳', '瑪加伯上', '瑪加伯下', '智慧篇', '德訓篇', '便西拉智訓', '巴錄書' 等
-              英文：'Tob', 'Jdt', '1Mac', '2Mac', 'Wis', 'Sir', 'Bar', 'Tobit', 'Judith', 'Sirach' 等
-        chapter: 章數
-        verse: 節數（可選）。支援多種格式：
-              - 單節：'1'
-              - 範圍：'1-5'
-              - 多節：'1,3,5'
-              - 混合：'1-2,5,8-10'
-              若不提供則返回整章
+async def _run_batch_call(call: BatchCall) -> str:
+    """Run one batch entry and return its JSON object text."""
+    name = to_compact_json(call.name)
+    tool = _BATCH_TOOLS.get(call.name)
+    try:
+        if tool is None:
+            raise ValueError(f"Unknown tool: {call.name}")
+        # Validate and coerce the arguments with the tool's argument model,
+        # exactly like a direct tools/call. Defaults are filled in, so the
+        # call shares cache entries with direct calls.
+        result = await tool.fn_metadata.call_fn_with_arg_validation(
+            tool.fn, tool.is_async, call.arguments, None
+        )
+    except Exception as e:
+        return f'{{"name":{name},"error":{to_compact_json(str(e))}}}'
+    # Tool results are already JSON text: splice them in instead of re-parsing
+    return f'{{"name":{name},"result":{result}}}'
+
+
+async def batch(calls: list[BatchCall]) -> str:
+    if len(calls) > BATCH_MAX_CALLS:
+        raise ValueError(f"A batch can contain at most {BATCH_MAX_CALLS} calls")
+    results = await asyncio.gather(*(_run_batch_call(call) for call in calls))
+    return "[" + ",".join(results) + "]"
+
+
+mcp.tool(
+    name="batch",
+    description=inspect.cleandoc(
+        f"""
+        一次呼叫多個工具（並行執行），減少往返次數。
+
+        適合需要大量查詢的情境，例如查詢一章中多節經文的 Strong's 編號或註釋。
+        每個呼叫各自回傳結果或錯誤，單一呼叫失敗不影響其他呼叫。
+
+        回傳 JSON 陣列，順序與 calls 相同：
+        - 成功: {{"name": 工具名稱, "result": 工具回傳內容}}
+        - 失敗: {{"name": 工具名稱, "error": 錯誤訊息}}
+
+        Args:
+            calls: 工具呼叫列表（最多 {BATCH_MAX_CALLS} 個），每項包含 name（工具名稱）與 arguments（參數物件）
+        """
+    ),
+    structured_output=False,
+)(batch)
+
+
+def _cache_tools_list_result() -> None:
     """
-    result = await http_get_apocrypha_verse(
-        book=book,
-        chapter=chapter,
-        verse=verse
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
+    Answer tools/list with a result built once.
 
-@mcp.tool()
-async def search_apocrypha(
-    query: str,
-    limit: int = 10,
-    offset: int = 0
-) -> str:
-    """在次經中搜尋關鍵字。
-    
-    Args:
-        query: 搜尋關鍵字
-        limit: 返回結果數量上限
-        offset: 跳過的結果數量（用於分頁）
+    The tool set is fixed after registration, but FastMCP rebuilds every Tool
+    model (and revalidates every name) on each tools/list request. The first
+    request goes through FastMCP's handler, which also fills the low-level
+    server's tool cache; later requests reuse that result.
     """
-    result = await http_search_apocrypha(
-        query=query,
-        limit=limit,
-        offset=offset
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def list_apocrypha_books() -> str:
-    """列出所有可用的次經書卷及其資訊。"""
-    result = await http_list_apocrypha_books()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    handlers = mcp._mcp_server.request_handlers
+    build_result = handlers[types.ListToolsRequest]
+    result = None
 
+    async def list_tools(request: types.ListToolsRequest) -> types.ServerResult:
+        nonlocal result
+        if result is None:
+            result = await build_result(request)
+        return result
 
-# ============================================================================
-# Apostolic Fathers Tools
-# ============================================================================
-
-@mcp.tool()
-async def get_apostolic_fathers_verse(
-    book: str,
-    chapter: int,
-    verse: str = None
-) -> str:
-    """查詢使徒教父文獻經文內容。
-    
-    Args:
-        book: 使徒教父書卷名稱
-        chapter: 章數
-        verse: 節數（可選）
-    """
-    result = await http_get_apostolic_fathers_verse(
-        book=book,
-        chapter=chapter,
-        verse=verse
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def search_apostolic_fathers(
-    query: str,
-    limit: int = 10,
-    offset: int = 0
-) -> str:
-    """在使徒教父文獻中搜尋關鍵字。
-    
-    Args:
-        query: 搜尋關鍵字
-        limit: 返回結果數量上限
-        offset: 跳過的結果數量（用於分頁）
-    """
-    result = await http_search_apostolic_fathers(
-        query=query,
-        limit=limit,
-        offset=offset
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    handlers[types.ListToolsRequest] = list_tools
 
 
-@mcp.tool()
-async def list_apostolic_fathers_books() -> str:
-    """列出所有可用的使徒教父書卷及其資訊。"""
-    result = await http_list_apostolic_fathers_books()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+_cache_tools_list_result()
 
 
-# ============================================================================
-# Footnotes Tools
-# ============================================================================
+# Argument-free list tools whose cached responses are filled at startup
+WARMUP_TOOLS = (
+    "list_bible_versions",
+    "list_commentaries",
+    "list_audio_versions",
+    "list_apocrypha_books",
+    "list_apostolic_fathers_books",
+    "list_fhl_article_columns",
+)
 
-@mcp.tool()
-async def get_bible_footnote(
-    book_id: int,
-    footnote_id: int,
-    use_simplified: bool = False
-) -> str:
-    """查詢聖經經文註腳（僅限 TCV 現代中文譯本）。
-    註腳提供原文翻譯的不同選擇、古卷差異說明、或其他重要補充資訊。
 
-    **重要提示**: 僅台灣聖經公會現代中文譯本 (TCV) 有註腳功能。
-    
-    Args:
-        book_id: 書卷編號 (1-66)。例如：1=創世記, 19=詩篇, 43=約翰福音, 45=羅馬書
-        footnote_id: 註腳編號（每個書卷有自己的編號系統）。從 1 開始遞增。若編號不存在，會返回空結果。
-        use_simplified: 是否使用簡體中文（預設：否）
+async def warm_up_tools():
     """
-    result = await http_get_bible_footnote(
-        book_id=book_id,
-        footnote_id=footnote_id,
-        use_simplified=use_simplified
-    )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
+    Call the WARMUP_TOOLS once with their default arguments.
 
-# ============================================================================
-# Articles Tools
-# ============================================================================
-
-@mcp.tool()
-async def search_fhl_articles(
-    title: str = None,
-    author: str = None,
-    content: str = None,
-    abstract: str = None,
-    column: str = None,
-    pub_date: str = None,
-    limit: int = 50,
-    include_content: bool = False,
-    use_simplified: bool = False
-) -> str:
-    """搜尋信望愛站的文章。
-
-    可以依據標題、作者、內容、摘要、專欄、發表日期等條件搜尋。
-    **至少需要提供一個搜尋條件**。
-
-    **回傳內容**：
-    - 預設模式 (include_content=false): 返回摘要和內容預覽（約 200 字）
-    - 完整模式 (include_content=true): 返回完整 HTML 內容
-
-    回傳文章列表，包含：
-    - 標題 (title)
-    - 作者 (author)
-    - 發表日期 (pubtime)
-    - 專欄 (column)
-    - 摘要 (abst)
-    - 內容預覽 (content_preview) 或完整內容 (content, HTML 格式)
-
-    ⚠️ **注意**: FHL API 不支援通過 ID 直接獲取文章，因此若需要完整內容，
-    請在搜尋時設定 include_content=true。
-    
-    Args:
-        title: 標題關鍵字
-        author: 作者名稱
-        content: 內文關鍵字
-        abstract: 摘要關鍵字
-        column: 專欄英文代碼（如 women3）。使用 list_fhl_article_columns 工具查看可用專欄
-        pub_date: 發表日期，格式為 YYYY.MM.DD（如 2025.10.19）
-        limit: 最多回傳結果數（預設：50，範圍：1-200）
-        include_content: 是否包含完整 HTML 內容（預設：false，只返回預覽）。設為 true 會返回完整文章內容，但輸出較大。
-        use_simplified: 是否使用簡體中文（預設：false，使用繁體）
+    The calls go through FastMCP like a client request, so they fill the same
+    response cache entries; the first real call is then a cache hit. A
+    failed warm-up (e.g. upstream unreachable) is logged and the tool simply
+    fetches on first use.
     """
-    result = await http_search_articles(
-        title=title,
-        author=author,
-        content=content,
-        abstract=abstract,
-        column=column,
-        pub_date=pub_date,
-        limit=limit,
-        include_content=include_content,
-        use_simplified=use_simplified
+    results = await asyncio.gather(
+        *(mcp.call_tool(name, {}) for name in WARMUP_TOOLS),
+        return_exceptions=True,
     )
-    return json.dumps(result, ensure_ascii=False, indent=2)
-
-
-@mcp.tool()
-async def list_fhl_article_columns() -> str:
-    """列出信望愛站可用的文章專欄。
-
-    回傳所有可搜尋的專欄，包含：
-    - 專欄代碼 (code): 用於 search_fhl_articles 的 column 參數
-    - 專欄名稱 (name): 中文名稱
-    - 專欄說明 (description): 專欄內容簡介
-
-    使用專欄代碼可以精確搜尋特定專欄的文章。
-
-    範例：
-    - 查看所有專欄：list_fhl_article_columns()
-    - 然後使用代碼搜尋：search_fhl_articles(column="women3")
-    """
-    result = await http_list_article_columns()
-    return json.dumps(result, ensure_ascii=False, indent=2)
+    for name, result in zip(WARMUP_TOOLS, results):
+        if isinstance(result, Exception):
+            logger.warning("Warm-up of %s failed: %s", name, result)
 
 
 # ============================================================================
@@ -877,21 +935,168 @@ class RootToMcpMiddleware:
         self.app = app
     
     async def __call__(self, scope, receive, send):
-        if scope.get('type') == 'http':
-            path = scope.get('path', '')
-            # Rewrite root path to /mcp for MCP protocol requests
-            # Keep well-known paths unchanged
-            if path == '/' or (path.startswith('/?') or '?' in path.split('/')[-1] if '?' in path else path == '/'):
-                # Check if this looks like an MCP request (POST or GET with query params)
-                method = scope.get('method', 'GET')
-                if method == 'POST' or (method == 'GET' and scope.get('query_string')):
-                    # Rewrite to /mcp
-                    scope = dict(scope)
-                    scope['path'] = '/mcp'
+        # Rewrite root path to /mcp for MCP protocol requests
+        # (the ASGI path never contains the query string; well-known paths
+        # are unchanged)
+        if scope['type'] == 'http' and scope['path'] == '/':
+            # Check if this looks like an MCP request (POST or GET with query params)
+            method = scope['method']
+            if method == 'POST' or (method == 'GET' and scope.get('query_string')):
+                # Rewrite to /mcp
+                scope = dict(scope)
+                scope['path'] = '/mcp'
         
         await self.app(scope, receive, send)
 
 
+class McpEndpointMiddleware:
+    """
+    Send requests for the MCP path straight to the FastMCP endpoint.
+
+    The endpoint is already a plain ASGI app; this skips Starlette's error
+    and exception middleware and the route scan for every MCP request.
+    Everything else (other paths, lifespan) goes through the Starlette app.
+    """
+    
+    def __init__(self, app, path, endpoint):
+        self.app = app
+        self.path = path
+        self.endpoint = endpoint
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and scope['path'] == self.path:
+            await self.endpoint(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+# CORS policy for browser-based clients: any origin, with credentials
+CORS_ALLOW_METHODS = ["GET", "POST", "OPTIONS"]
+CORS_EXPOSE_HEADERS = ["mcp-session-id", "mcp-protocol-version"]
+CORS_MAX_AGE = 86400
+
+# Compress JSON responses above this size (CJK text shrinks several times).
+# SSE streams (text/event-stream) must not be gzipped: Starlette >= 0.46
+# excludes them (older GZipMiddleware buffers and compresses them, which
+# breaks MCP streaming), hence the starlette>=0.46 floor in pyproject.toml
+GZIP_MINIMUM_SIZE = 1024
+GZIP_COMPRESSLEVEL = 6
+
+
+def _preflight_response(method_allowed: bool, private_network: bool):
+    """Status, body and entity headers of a preflight answer."""
+    failures = []
+    if not method_allowed:
+        failures.append("method")
+    if private_network:
+        failures.append("private-network")
+
+    if failures:
+        status, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode("utf-8")
+    else:
+        status, body = 200, b"OK"
+    headers = [
+        (b"content-length", str(len(body)).encode("latin-1")),
+        (b"content-type", b"text/plain; charset=utf-8"),
+    ]
+    return status, body, headers
+
+
+class PrebuiltCORSMiddleware:
+    """
+    CORS for browser-based clients with all response headers built up front.
+
+    Behaves like Starlette's CORSMiddleware configured with allow_origins=["*"],
+    allow_credentials=True, allow_headers=["*"] and the CORS_* settings above:
+    the request origin is echoed (a literal "*" is not allowed together with
+    credentials) and requested preflight headers are mirrored. Preflights
+    are answered here without reaching the rest of the stack; other requests
+    get the CORS headers added to their response start message.
+    """
+
+    _preflight_headers = [
+        (b"vary", b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+                  b"Access-Control-Request-Private-Network"),
+        (b"access-control-allow-methods", ", ".join(CORS_ALLOW_METHODS).encode("latin-1")),
+        (b"access-control-max-age", str(CORS_MAX_AGE).encode("latin-1")),
+        (b"access-control-allow-credentials", b"true"),
+    ]
+    _simple_headers = [
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-expose-headers", ", ".join(CORS_EXPOSE_HEADERS).encode("latin-1")),
+    ]
+    _replaced_headers = {
+        b"access-control-allow-origin",
+        b"access-control-allow-credentials",
+        b"access-control-expose-headers",
+        b"vary",
+    }
+    _allowed_methods = {method.encode("latin-1") for method in CORS_ALLOW_METHODS}
+    # (method allowed, private network requested) -> (status, body, headers)
+    _preflight_responses = {
+        (method_allowed, private_network): _preflight_response(method_allowed, private_network)
+        for method_allowed in (True, False)
+        for private_network in (True, False)
+    }
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        private_network = False
+        for name, value in scope['headers']:
+            if name == b'origin':
+                origin = value
+            elif name == b'access-control-request-method':
+                request_method = value
+            elif name == b'access-control-request-headers':
+                request_headers = value
+            elif name == b'access-control-request-private-network':
+                private_network = True
+
+        if origin is not None and scope['method'] == 'OPTIONS' and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, private_network, send)
+            return
+
+        async def send_with_cors(message):
+            if message['type'] == 'http.response.start':
+                headers = []
+                vary = []
+                for name, value in message.get('headers', ()):
+                    if name.lower() == b'vary':
+                        vary.append(value)
+                    elif origin is None or name.lower() not in self._replaced_headers:
+                        headers.append((name, value))
+                if origin is not None:
+                    headers.append((b"access-control-allow-origin", origin))
+                    headers.extend(self._simple_headers)
+                vary.append(b"Origin")
+                headers.append((b"vary", b", ".join(vary)))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, origin, request_method, request_headers, private_network, send):
+        headers = list(self._preflight_headers)
+        headers.append((b"access-control-allow-origin", origin))
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        status, body, entity_headers = self._preflight_responses[
+            (request_method in self._allowed_methods, private_network)
+        ]
+        headers.extend(entity_headers)
+
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+
 def create_http_app():
     """
     Create and configure the Starlette app for HTTP deployment.
@@ -915,66 +1120,112 @@ def create_http_app():
     # Create a combined lifespan that wraps the FastMCP lifespan
     @asynccontextmanager
     async def combined_lifespan(app):
-        """Combined lifespan that initializes FastMCP session manager."""
+        """Combined lifespan that initializes FastMCP session manager and the shared HTTP pool."""
         logger.info("Starting lifespan - initializing session manager...")
-        # Use the session_manager.run() directly since that's what FastMCP's lifespan does
-        async with mcp.session_manager.run():
-            logger.info("Session manager initialized successfully")
-            yield
+        # One upstream connection pool for all tool calls, created on the server's event loop
+        http_client = create_http_client()
+        set_shared_http_client(http_client)
+        # One FHLAPIEndpoints (on that pool) reused by the http_* tools
+        set_shared_endpoints(FHLAPIEndpoints())
+        try:
+            # Use the session_manager.run() directly since that's what FastMCP's lifespan does
+            async with mcp.session_manager.run():
+                logger.info("Session manager initialized successfully")
+                # Prefill list-tool responses in the background; startup does not wait
+                warmup = asyncio.create_task(warm_up_tools())
+                try:
+                    yield
+                finally:
+                    warmup.cancel()
+        finally:
+            set_shared_endpoints(None)
+            set_shared_http_client(None)
+            await http_client.aclose()
         logger.info("Session manager shutdown complete")
     
-    # Create routes for well-known endpoints
+    # Routes are matched in order: the FastMCP /mcp route goes first so MCP
+    # requests (the hot path) match without scanning the other routes.
+    # Its routes are used directly instead of Mount("/", mcp_app), which
+    # saves a nested router (FastMCP adds no middleware without auth).
     routes = [
+        *mcp_app.routes,
         # Well-known endpoints for Smithery discovery
         Route("/.well-known/mcp-config", well_known_mcp_config, methods=["GET"]),
         Route("/.well-known/mcp/server-card.json", well_known_server_card, methods=["GET"]),
-        Route("/health", health_check, methods=["GET"]),
-        # Mount the FastMCP app (handles /mcp path internally)
-        Mount("/", app=mcp_app),
+        Route("/health", health_check, methods=["GET", "HEAD"]),
     ]
     
     app = Starlette(routes=routes, lifespan=combined_lifespan)
     
-    # Add CORS middleware for browser-based clients
-    # IMPORTANT: CORS must be configured before other middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["GET", "POST", "OPTIONS"],
-        allow_headers=["*"],
-        expose_headers=["mcp-session-id", "mcp-protocol-version"],
-        max_age=86400,
-    )
+    # Fast path for the MCP endpoint; the Starlette route above still handles
+    # variants such as the trailing-slash redirect
+    mcp_path = mcp.settings.streamable_http_path
+    mcp_route = next(route for route in mcp_app.routes if route.path == mcp_path)
+    app = McpEndpointMiddleware(app, mcp_path, mcp_route.app)
     
     # Apply Smithery config middleware for per-request configuration
-    app = SmitheryConfigMiddleware(app)
+    app = smithery_config_middleware(app)
     
     # Apply path rewrite middleware: "/" -> "/mcp"
     app = RootToMcpMiddleware(app)
     
+    # Compress large JSON responses (tool results in json_response mode)
+    app = GZipMiddleware(
+        app, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESSLEVEL
+    )
+    
+    # CORS for browser-based clients; preflights are answered here directly
+    app = PrebuiltCORSMiddleware(app)
+    
     return app
 
 
 def main():
     """Main entry point for HTTP server"""
-    transport_mode = os.getenv("TRANSPORT", "http")
-    
-    if transport_mode == "http":
-        logger.info("FHL Bible MCP Server starting in HTTP mode...")
-        
-        # Create the HTTP app with all middleware
-        app = create_http_app()
+    if SETTINGS.transport == "http":
+        logger.info(
+            "FHL Bible MCP Server starting in HTTP mode: port %d, %d worker(s), "
+            "%d tools registered, MCP endpoint / -> /mcp (Streamable HTTP), "
+            "well-known /.well-known/mcp-config and /.well-known/mcp/server-card.json",
+            SETTINGS.port,
+            SETTINGS.workers,
+            len(mcp._tool_manager.list_tools()),
+        )
         
-        # Use Smithery-required PORT environment variable
-        port = int(os.environ.get("PORT", 8081))
+        # Only the HTTP transport needs the ASGI server
+        import uvicorn
         
-        logger.info(f"Listening on port {port}")
-        logger.info(f"MCP endpoint: / -> /mcp (Streamable HTTP with path rewrite)")
-        logger.info(f"Well-known: /.well-known/mcp-config, /.well-known/mcp/server-card.json")
+        # Run with uvicorn using uvloop + httptools (uvicorn[standard]).
+        # uvloop is not available on Windows, fall back to the asyncio loop there.
+        # Access logs are disabled: every MCP call would otherwise log a line.
+        options = dict(
+            host="0.0.0.0",
+            port=SETTINGS.port,
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            log_level=SETTINGS.log_level,
+            access_log=False,
+            # Bound memory under traffic spikes: excess connections get 503
+            # instead of queueing without limit (see HTTPSettings)
+            limit_concurrency=SETTINGS.limit_concurrency or None,
+            backlog=SETTINGS.backlog,
+            timeout_keep_alive=SETTINGS.timeout_keep_alive,
+        )
         
-        # Run with uvicorn
-        uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+        if SETTINGS.workers > 1:
+            # Multiple workers need an import string so each process builds its own app.
+            # Recycle workers periodically; the uvicorn supervisor restarts them.
+            # (Not used with a single process, where it would stop the server.)
+            uvicorn.run(
+                "fhl_bible_mcp.http_server:get_app",
+                factory=True,
+                workers=SETTINGS.workers,
+                limit_max_requests=SETTINGS.limit_max_requests or None,
+                **options,
+            )
+        else:
+            # Create the HTTP app with all middleware
+            uvicorn.run(create_http_app(), **options)
     
     else:
         # STDIO mode for local development and backward compatibility
@@ -10,18 +10,211 @@ direct keyword arguments, while the original handlers expect
 (api_client, arguments) signature.
 """
 
-import json
 import logging
+import re
 from typing import Any, Optional
 
-from fhl_bible_mcp.api.endpoints import FHLAPIEndpoints
+from fhl_bible_mcp.api.endpoints import ARTICLE_COLUMNS, get_endpoints
 
 # Import existing tool modules for their helper data
 from fhl_bible_mcp.tools.apocrypha import APOCRYPHA_BOOKS
 from fhl_bible_mcp.tools.apostolic_fathers import APOSTOLIC_FATHERS_BOOKS
 
+# Underlying tool functions (imported once here, not inside every call)
+from fhl_bible_mcp.tools.audio import get_audio_bible
+from fhl_bible_mcp.tools.commentary import get_commentary
+from fhl_bible_mcp.tools.info import get_book_info, get_book_list
+from fhl_bible_mcp.tools.search import search_bible_advanced
+from fhl_bible_mcp.tools.strongs import search_strongs_occurrences
+
 logger = logging.getLogger(__name__)
 
+# Matches one HTML tag (used to build plain-text article previews)
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def _build_bid_to_name(books: dict[str, dict[str, Any]]) -> dict[Any, str]:
+    """
+    Map book ID -> Chinese name (several abbreviations share one ID)
+    
+    Both the int ID and its string form are keys, so the "bid" of an API
+    record can be looked up as-is, whichever type it comes back as.
+    """
+    return {
+        key: info["name_zh"]
+        for info in books.values()
+        for key in (info["id"], str(info["id"]))
+    }
+
+
+def _build_books_list(books: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """Group abbreviations by book ID and return the books sorted by ID"""
+    books_by_id: dict[int, dict[str, Any]] = {}
+    for abbr, info in books.items():
+        book = books_by_id.setdefault(info["id"], {
+            "id": info["id"],
+            "name_zh": info["name_zh"],
+            "name_en": info["name_en"],
+            "abbreviations": []
+        })
+        book["abbreviations"].append(abbr)
+    
+    return [books_by_id[book_id] for book_id in sorted(books_by_id)]
+
+
+def _format_search_record(
+    verse_obj: dict[str, Any], bid_to_name: dict[Any, str]
+) -> dict[str, Any]:
+    """Format one apocrypha / apostolic fathers search hit"""
+    bid = verse_obj.get("bid", "")
+    # The record's own book name is only read when the ID is unknown
+    book_name = (bid_to_name.get(bid) or verse_obj.get("chineses", "")) if bid else ""
+    return {
+        "book": book_name,
+        "book_id": bid,
+        "chapter": verse_obj.get("chap", ""),
+        "verse": verse_obj.get("sec", ""),
+        "text": verse_obj.get("bible_text", "")
+    }
+
+
+def _error_response(result: dict[str, Any]) -> dict[str, Any]:
+    """Tool response for an unsuccessful upstream result"""
+    return {
+        "status": "error",
+        "error": result.get("error", "未知錯誤")
+    }
+
+
+def _build_books_response(
+    books: dict[str, dict[str, Any]], query_type: str, id_range: str
+) -> dict[str, Any]:
+    """Build the complete list-books tool response"""
+    books_list = _build_books_list(books)
+    return {
+        "status": "success",
+        "query_type": query_type,
+        "id_range": id_range,
+        "book_count": len(books_list),
+        "books": books_list
+    }
+
+
+# The book and column tables are static, so the lookups and the complete
+# list-tool responses are built once and returned as-is on every call
+_APOCRYPHA_DISPLAY_NAMES = {abbr: info["name_zh"] for abbr, info in APOCRYPHA_BOOKS.items()}
+_APOCRYPHA_BID_TO_NAME = _build_bid_to_name(APOCRYPHA_BOOKS)
+_APOCRYPHA_BOOKS_RESPONSE = _build_books_response(
+    APOCRYPHA_BOOKS, "list_apocrypha_books", "101-115"
+)
+_APOSTOLIC_FATHERS_DISPLAY_NAMES = {
+    abbr: info["name_zh"] for abbr, info in APOSTOLIC_FATHERS_BOOKS.items()
+}
+_APOSTOLIC_FATHERS_BID_TO_NAME = _build_bid_to_name(APOSTOLIC_FATHERS_BOOKS)
+_APOSTOLIC_FATHERS_BOOKS_RESPONSE = _build_books_response(
+    APOSTOLIC_FATHERS_BOOKS, "list_apostolic_fathers_books", "201-217"
+)
+_ARTICLE_COLUMNS_RESPONSE = {
+    "status": "success",
+    "query_type": "list_article_columns",
+    "column_count": len(ARTICLE_COLUMNS),
+    "columns": [
+        {
+            "code": col['code'],
+            "name": col['name'],
+            "description": col['description']
+        }
+        for col in ARTICLE_COLUMNS
+    ]
+}
+
+
+# ============================================================================
+# Search / Strong's / Commentary Tools (Fixed signatures)
+# ============================================================================
+
+async def http_search_bible_advanced(
+    query: str,
+    search_type: str = "keyword",
+    range_start: int = None,
+    range_end: int = None,
+    version: str = "unv",
+    limit: int = 50,
+    offset: int = 0,
+    use_simplified: bool = False,
+) -> dict[str, Any]:
+    """
+    進階聖經搜尋 (HTTP version)
+    
+    Args:
+        query: 搜尋內容
+        search_type: 搜尋類型（keyword/greek_number/hebrew_number）
+        range_start: 起始書卷編號 (1-66)
+        range_end: 結束書卷編號 (1-66)
+        version: 聖經版本代碼
+        limit: 最多返回筆數
+        offset: 跳過筆數
+        use_simplified: 是否使用簡體中文
+    
+    Note: book ranges are exposed as integers
+    """
+    return await search_bible_advanced(
+        query=query,
+        search_type=search_type,
+        range_start=range_start,
+        range_end=range_end,
+        version=version,
+        limit=limit,
+        offset=offset,
+        use_simplified=use_simplified,
+    )
+
+
+async def http_search_strongs_occurrences(
+    number: str,
+    testament: str = None,
+    limit: int = 50,
+    use_simplified: bool = False,
+) -> dict[str, Any]:
+    """
+    搜尋 Strong's Number 出現位置 (HTTP version)
+    
+    Args:
+        number: Strong's Number（如 'G1344' 或 'H430'）
+        testament: 約別（當 number 包含 G/H 前綴時可省略）
+        limit: 最多返回筆數（HTTP 預設 50）
+        use_simplified: 是否使用簡體中文
+    """
+    return await search_strongs_occurrences(
+        number=number,
+        testament=testament,
+        limit=limit,
+        use_simplified=use_simplified,
+    )
+
+
+async def http_get_commentary(
+    book: str,
+    chapter: int,
+    verse: int = None,
+    use_simplified: bool = False,
+) -> dict[str, Any]:
+    """
+    查詢經文註釋 (HTTP version)
+    
+    Args:
+        book: 書卷名稱
+        chapter: 章數
+        verse: 節數（可選）
+        use_simplified: 是否使用簡體中文
+    """
+    return await get_commentary(
+        book=book,
+        chapter=chapter,
+        verse=verse,
+        use_simplified=use_simplified,
+    )
+
 
 # ============================================================================
 # Info Tools (Fixed signatures)
@@ -38,7 +231,6 @@ async def http_get_book_list(
     
     Note: use_simplified is not supported by the underlying function
     """
-    from fhl_bible_mcp.tools.info import get_book_list
     return await get_book_list(testament=testament)
 
 
@@ -53,7 +245,6 @@ async def http_get_book_info(
     
     Note: use_simplified is not supported by the underlying function
     """
-    from fhl_bible_mcp.tools.info import get_book_info
     return await get_book_info(book=book)
 
 
@@ -74,7 +265,6 @@ async def http_get_audio_bible(
         chapter: 章數
         audio_version: 有聲聖經版本代碼 (not 'version')
     """
-    from fhl_bible_mcp.tools.audio import get_audio_bible
     return await get_audio_bible(
         book=book,
         chapter=chapter,
@@ -96,10 +286,9 @@ async def http_get_apocrypha_verse(
     
     Adapts handle_get_apocrypha_verse(api_client, arguments) to direct kwargs.
     """
-    async with FHLAPIEndpoints() as api:
-        # Get book info for display name
-        book_info = APOCRYPHA_BOOKS.get(book)
-        display_name = book_info["name_zh"] if book_info else book
+    async with get_endpoints() as api:
+        # Chinese display name (unknown names are shown as given)
+        display_name = _APOCRYPHA_DISPLAY_NAMES.get(book, book)
         
         result = await api.get_apocrypha_verse(
             book=book,
@@ -115,15 +304,16 @@ async def http_get_apocrypha_verse(
             records = result.get("record", [])
             bid = records[0].get("bid", "未知") if records else "未知"
             
-            verses = []
-            for verse_obj in records:
-                verses.append({
+            verses = [
+                {
                     "book": display_name,
                     "book_id": verse_obj.get("bid", bid),
                     "chapter": chapter,
                     "verse": verse_obj.get("sec", ""),
                     "text": verse_obj.get("bible_text", "")
-                })
+                }
+                for verse_obj in records
+            ]
             
             return {
                 "status": "success",
@@ -140,10 +330,7 @@ async def http_get_apocrypha_verse(
                 "verses": verses
             }
         else:
-            return {
-                "status": "error",
-                "error": result.get("error", "未知錯誤")
-            }
+            return _error_response(result)
 
 
 async def http_search_apocrypha(
@@ -154,12 +341,7 @@ async def http_search_apocrypha(
     """
     搜尋次經 (HTTP version)
     """
-    # Build bid to name mapping
-    bid_to_name = {}
-    for abbr, info in APOCRYPHA_BOOKS.items():
-        bid_to_name[info["id"]] = info["name_zh"]
-    
-    async with FHLAPIEndpoints() as api:
+    async with get_endpoints() as api:
         result = await api.search_apocrypha(
             query=query,
             limit=limit,
@@ -169,18 +351,10 @@ async def http_search_apocrypha(
         if result.get("status") == "success":
             record_count = result.get("record_count", 0)
             
-            results = []
-            for verse_obj in result.get("record", []):
-                bid = verse_obj.get("bid", "")
-                book_name = bid_to_name.get(int(bid), verse_obj.get("chineses", "")) if bid else ""
-                
-                results.append({
-                    "book": book_name,
-                    "book_id": bid,
-                    "chapter": verse_obj.get("chap", ""),
-                    "verse": verse_obj.get("sec", ""),
-                    "text": verse_obj.get("bible_text", "")
-                })
+            results = [
+                _format_search_record(verse_obj, _APOCRYPHA_BID_TO_NAME)
+                for verse_obj in result.get("record", [])
+            ]
             
             return {
                 "status": "success",
@@ -192,43 +366,14 @@ async def http_search_apocrypha(
                 "results": results
             }
         else:
-            return {
-                "status": "error",
-                "error": result.get("error", "未知錯誤")
-            }
+            return _error_response(result)
 
 
 async def http_list_apocrypha_books() -> dict[str, Any]:
     """
     列出所有次經書卷 (HTTP version)
     """
-    # Group by book ID
-    books_by_id: dict[int, dict[str, Any]] = {}
-    for abbr, info in APOCRYPHA_BOOKS.items():
-        book_id = info["id"]
-        if book_id not in books_by_id:
-            books_by_id[book_id] = info.copy()
-            books_by_id[book_id]["abbrs"] = []
-        books_by_id[book_id]["abbrs"].append(abbr)
-    
-    # Build books list
-    books_list = []
-    for book_id in sorted(books_by_id.keys()):
-        info = books_by_id[book_id]
-        books_list.append({
-            "id": book_id,
-            "name_zh": info["name_zh"],
-            "name_en": info["name_en"],
-            "abbreviations": info["abbrs"]
-        })
-    
-    return {
-        "status": "success",
-        "query_type": "list_apocrypha_books",
-        "id_range": "101-115",
-        "book_count": len(books_list),
-        "books": books_list
-    }
+    return _APOCRYPHA_BOOKS_RESPONSE
 
 
 # ============================================================================
@@ -243,10 +388,9 @@ async def http_get_apostolic_fathers_verse(
     """
     查詢使徒教父文獻經文 (HTTP version)
     """
-    async with FHLAPIEndpoints() as api:
-        # Get book info for display name
-        book_info = APOSTOLIC_FATHERS_BOOKS.get(book)
-        display_name = book_info["name_zh"] if book_info else book
+    async with get_endpoints() as api:
+        # Chinese display name (unknown names are shown as given)
+        display_name = _APOSTOLIC_FATHERS_DISPLAY_NAMES.get(book, book)
         
         result = await api.get_apostolic_fathers_verse(
             book=book,
@@ -262,15 +406,16 @@ async def http_get_apostolic_fathers_verse(
             records = result.get("record", [])
             bid = records[0].get("bid", "未知") if records else "未知"
             
-            verses = []
-            for verse_obj in records:
-                verses.append({
+            verses = [
+                {
                     "book": display_name,
                     "book_id": verse_obj.get("bid", bid),
                     "chapter": chapter,
                     "verse": verse_obj.get("sec", ""),
                     "text": verse_obj.get("bible_text", "")
-                })
+                }
+                for verse_obj in records
+            ]
             
             return {
                 "status": "success",
@@ -287,10 +432,7 @@ async def http_get_apostolic_fathers_verse(
                 "verses": verses
             }
         else:
-            return {
-                "status": "error",
-                "error": result.get("error", "未知錯誤")
-            }
+            return _error_response(result)
 
 
 async def http_search_apostolic_fathers(
@@ -301,12 +443,7 @@ async def http_search_apostolic_fathers(
     """
     搜尋使徒教父文獻 (HTTP version)
     """
-    # Build bid to name mapping
-    bid_to_name = {}
-    for abbr, info in APOSTOLIC_FATHERS_BOOKS.items():
-        bid_to_name[info["id"]] = info["name_zh"]
-    
-    async with FHLAPIEndpoints() as api:
+    async with get_endpoints() as api:
         result = await api.search_apostolic_fathers(
             query=query,
             limit=limit,
@@ -316,18 +453,10 @@ async def http_search_apostolic_fathers(
         if result.get("status") == "success":
             record_count = result.get("record_count", 0)
             
-            results = []
-            for verse_obj in result.get("record", []):
-                bid = verse_obj.get("bid", "")
-                book_name = bid_to_name.get(int(bid), verse_obj.get("chineses", "")) if bid else ""
-                
-                results.append({
-                    "book": book_name,
-                    "book_id": bid,
-                    "chapter": verse_obj.get("chap", ""),
-                    "verse": verse_obj.get("sec", ""),
-                    "text": verse_obj.get("bible_text", "")
-                })
+            results = [
+                _format_search_record(verse_obj, _APOSTOLIC_FATHERS_BID_TO_NAME)
+                for verse_obj in result.get("record", [])
+            ]
             
             return {
                 "status": "success",
@@ -339,43 +468,14 @@ async def http_search_apostolic_fathers(
                 "results": results
             }
         else:
-            return {
-                "status": "error",
-                "error": result.get("error", "未知錯誤")
-            }
+            return _error_response(result)
 
 
 async def http_list_apostolic_fathers_books() -> dict[str, Any]:
     """
     列出所有使徒教父書卷 (HTTP version)
     """
-    # Group by book ID
-    books_by_id: dict[int, dict[str, Any]] = {}
-    for abbr, info in APOSTOLIC_FATHERS_BOOKS.items():
-        book_id = info["id"]
-        if book_id not in books_by_id:
-            books_by_id[book_id] = info.copy()
-            books_by_id[book_id]["abbrs"] = []
-        books_by_id[book_id]["abbrs"].append(abbr)
-    
-    # Build books list
-    books_list = []
-    for book_id in sorted(books_by_id.keys()):
-        info = books_by_id[book_id]
-        books_list.append({
-            "id": book_id,
-            "name_zh": info["name_zh"],
-            "name_en": info["name_en"],
-            "abbreviations": info["abbrs"]
-        })
-    
-    return {
-        "status": "success",
-        "query_type": "list_apostolic_fathers_books",
-        "id_range": "201-217",
-        "book_count": len(books_list),
-        "books": books_list
-    }
+    return _APOSTOLIC_FATHERS_BOOKS_RESPONSE
 
 
 # ============================================================================
@@ -391,7 +491,7 @@ async def http_get_bible_footnote(
     查詢聖經經文註腳 (HTTP version)
     僅限 TCV 現代中文譯本
     """
-    async with FHLAPIEndpoints() as api:
+    async with get_endpoints() as api:
         result = await api.get_footnote(
             book_id=book_id,
             footnote_id=footnote_id,
@@ -420,10 +520,7 @@ async def http_get_bible_footnote(
                     "message": f"找不到書卷 {book_id} 的註腳 #{footnote_id}"
                 }
         else:
-            return {
-                "status": "error",
-                "error": result.get("error", "未知錯誤")
-            }
+            return _error_response(result)
 
 
 # ============================================================================
@@ -444,7 +541,7 @@ async def http_search_articles(
     """
     搜尋信望愛站文章 (HTTP version)
     """
-    async with FHLAPIEndpoints() as api:
+    async with get_endpoints() as api:
         result = await api.search_articles(
             title=title,
             author=author,
@@ -456,7 +553,11 @@ async def http_search_articles(
             limit=limit
         )
         
-        if result.get("status") == 1 and result.get("record_count", 0) > 0:
+        # Read the response fields once
+        status = result.get("status")
+        record_count = result.get("record_count", 0)
+        
+        if status == 1 and record_count > 0:
             articles = result.get("record", [])
             
             if not articles:
@@ -478,15 +579,14 @@ async def http_search_articles(
                     "abstract": article.get("abst", ""),
                 }
                 
+                full_content = article.get("content", "")
                 if include_content:
-                    formatted["content"] = article.get("content", "")
+                    formatted["content"] = full_content
                 else:
                     # Content preview (first 200 chars)
-                    full_content = article.get("content", "")
                     if full_content:
                         # Strip HTML tags for preview
-                        import re
-                        clean_text = re.sub(r'<[^>]+>', '', full_content)
+                        clean_text = _HTML_TAG_PATTERN.sub('', full_content)
                         formatted["content_preview"] = clean_text[:200] + "..." if len(clean_text) > 200 else clean_text
                 
                 formatted_articles.append(formatted)
@@ -494,22 +594,23 @@ async def http_search_articles(
             return {
                 "status": "success",
                 "query_type": "article_search",
-                "total_count": result.get("record_count", len(formatted_articles)),
+                "total_count": record_count,
                 "returned_count": len(formatted_articles),
                 "include_full_content": include_content,
                 "articles": formatted_articles
             }
         
-        elif result.get("status") == 0:
+        elif status == 0:
             error_msg = result.get("result", "Unknown error")
+            error_text = error_msg.lower()
             
-            if "data too much" in error_msg.lower():
+            if "data too much" in error_text:
                 return {
                     "status": "error",
                     "error": "資料量過大，請提供至少一個搜尋條件",
                     "hint": "請使用 title, author, content, abstract, column 或 pub_date 參數"
                 }
-            elif "no data" in error_msg.lower():
+            elif "no data" in error_text:
                 return {
                     "status": "no_results",
                     "message": "未找到符合條件的文章"
@@ -531,19 +632,4 @@ async def http_list_article_columns() -> dict[str, Any]:
     """
     列出信望愛站文章專欄 (HTTP version)
     """
-    async with FHLAPIEndpoints() as api_client:
-        columns = api_client.list_article_columns()
-    
-    return {
-        "status": "success",
-        "query_type": "list_article_columns",
-        "column_count": len(columns),
-        "columns": [
-            {
-                "code": col['code'],
-                "name": col['name'],
-                "description": col['description']
-            }
-            for col in columns
-        ]
-    }
+    return _ARTICLE_COLUMNS_RESPONSE
@@ -332,6 +332,17 @@ class ResourceRouter:
         self.strongs_handler = StrongsResourceHandler(endpoints)
         self.commentary_handler = CommentaryResourceHandler(endpoints)
         self.info_handler = InfoResourceHandler(endpoints)
+        
+        # 路由表：bible:// 依資源類型（netloc），其他依 scheme
+        self._bible_routes = {
+            "verse": self.bible_handler.handle_verse,
+            "chapter": self.bible_handler.handle_chapter,
+        }
+        self._scheme_routes = {
+            "strongs": self.strongs_handler.handle,
+            "commentary": self.commentary_handler.handle,
+            "info": self.info_handler.handle,
+        }
     
     async def handle_resource(self, uri: str) -> Dict[str, Any]:
         """
@@ -355,24 +366,19 @@ class ResourceRouter:
             # urlparse 將 verse/chapter 視為 netloc
             # 所以需要檢查 netloc 而不是 path
             resource_type = parsed.netloc
-            if resource_type == "verse":
-                return await self.bible_handler.handle_verse(uri_str)
-            elif resource_type == "chapter":
-                return await self.bible_handler.handle_chapter(uri_str)
-            else:
+            handler = self._bible_routes.get(resource_type)
+            if handler is None:
                 raise ResourceError(
                     f"不支援的 bible:// 資源類型: {resource_type}。支援的類型: verse, chapter"
                 )
-        elif scheme == "strongs":
-            return await self.strongs_handler.handle(uri_str)
-        elif scheme == "commentary":
-            return await self.commentary_handler.handle(uri_str)
-        elif scheme == "info":
-            return await self.info_handler.handle(uri_str)
-        else:
+            return await handler(uri_str)
+        
+        handler = self._scheme_routes.get(scheme)
+        if handler is None:
             raise ResourceError(
                 f"不支援的 URI scheme: {scheme}。支援的 scheme: bible, strongs, commentary, info"
             )
+        return await handler(uri_str)
     
     def list_supported_resources(self) -> Dict[str, list]:
         """
@@ -8,12 +8,18 @@ Based on Smithery requirements:
 https://smithery.ai/docs/build/deployments/python
 """
 
-import json
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP, Context
 from smithery.decorators import smithery
 from pydantic import BaseModel, Field
 from typing import Optional
 
+from fhl_bible_mcp.api.client import (
+    create_http_client,
+    get_shared_http_client,
+    set_shared_http_client,
+)
+
 # Import all tool functions
 from fhl_bible_mcp.tools.verse import (
     get_bible_verse,
@@ -47,22 +53,25 @@ from fhl_bible_mcp.tools.audio import (
     get_audio_chapter_with_text,
 )
 from fhl_bible_mcp.tools.apocrypha import (
-    handle_get_apocrypha_verse,
     handle_search_apocrypha,
-    handle_list_apocrypha_books,
 )
 from fhl_bible_mcp.tools.apostolic_fathers import (
-    handle_get_apostolic_fathers_verse,
     handle_search_apostolic_fathers,
-    handle_list_apostolic_fathers_books,
-)
-from fhl_bible_mcp.tools.footnotes import (
-    handle_get_bible_footnote,
 )
 from fhl_bible_mcp.tools.articles import (
     handle_search_articles,
-    handle_list_article_columns,
 )
+# handle_* 工具函數的參數為 (api_client, arguments)，可快取的工具改用 kwargs 版本
+from fhl_bible_mcp.http_tools import (
+    http_get_apocrypha_verse,
+    http_list_apocrypha_books,
+    http_get_apostolic_fathers_verse,
+    http_list_apostolic_fathers_books,
+    http_get_bible_footnote,
+    http_list_article_columns,
+)
+from fhl_bible_mcp.utils.cache import list_cached, lookup_cached, single_flight
+from fhl_bible_mcp.utils.serialization import to_json
 
 
 # ============================================================================
@@ -77,6 +86,71 @@ class ConfigSchema(BaseModel):
     )
 
 
+def _resolve_simplified(ctx: Optional[Context], default: bool) -> bool:
+    """Session 設定的 use_simplified 優先於工具參數"""
+    session_config = getattr(ctx, 'session_config', None)
+    if session_config:
+        return getattr(session_config, 'use_simplified', default)
+    return default
+
+
+# ============================================================================
+# Shared Upstream Connection Pool
+# ============================================================================
+
+# 本模組建立的連線池，以及正在使用它的 session 數
+_pool_client = None
+_pool_sessions = 0
+
+
+@asynccontextmanager
+async def _shared_http_pool(server: FastMCP):
+    """
+    確保同時進行的 session 共用同一個上游連線池（HTTP/2、keep-alive）
+
+    FastMCP 的 lifespan 在每個 session 開始時執行。第一個 session 建立連線池，
+    同時進行的其他 session 沿用它；最後一個 session 結束時關閉並移除連線池，
+    不會留下已關閉的 client 或洩漏連線。
+    已有其他程式（如 http_server）安裝連線池時不建立也不關閉。
+    """
+    global _pool_client, _pool_sessions
+    if _pool_sessions == 0 and get_shared_http_client() is None:
+        _pool_client = create_http_client()
+        set_shared_http_client(_pool_client)
+    _pool_sessions += 1
+    try:
+        yield {}
+    finally:
+        _pool_sessions -= 1
+        if _pool_sessions == 0 and _pool_client is not None:
+            client, _pool_client = _pool_client, None
+            set_shared_http_client(None)
+            await client.aclose()
+
+
+# ============================================================================
+# Cached Tool Results
+# ============================================================================
+
+@single_flight
+async def _call_json(func, **kwargs) -> str:
+    """
+    呼叫工具函數並將結果序列化為 JSON 文字
+
+    同時進行中的相同呼叫（如多個客戶端同時查詢同一節熱門經文）
+    共用一次上游請求與一次序列化。
+    """
+    return to_json(await func(**kwargs))
+
+
+# 目錄類工具（版本、註釋書、書卷、專欄列表）的結果幾乎不變，
+# 以函數與參數為鍵快取序列化後的 JSON 文字，重複呼叫不需再打 API 或重新序列化
+_list_json = list_cached(_call_json)
+
+# 經文、原文、註腳查詢的結果不會改變，熱門經文（如 約 3:16）重複查詢時直接回傳
+_lookup_json = lookup_cached(_call_json)
+
+
 # ============================================================================
 # Smithery Server Creation Function
 # ============================================================================
@@ -90,7 +164,8 @@ def create_server():
     
     server = FastMCP(
         name="FHL Bible MCP Server",
-        instructions="信望愛聖經工具 MCP 伺服器 - 提供聖經查詢、原文分析、註釋、有聲聖經等功能。"
+        instructions="信望愛聖經工具 MCP 伺服器 - 提供聖經查詢、原文分析、註釋、有聲聖經等功能。",
+        lifespan=_shared_http_pool,
     )
     
     # ========================================================================
@@ -117,10 +192,10 @@ def create_server():
             include_strong: 是否包含 Strong's Number（預設：false）
             use_simplified: 是否使用簡體中文（預設：false）
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
         
-        result = await get_bible_verse(
+        return await _lookup_json(
+            get_bible_verse,
             book=book,
             chapter=chapter,
             verse=verse,
@@ -128,7 +203,6 @@ def create_server():
             include_strong=include_strong,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def get_bible_chapter_tool(
@@ -146,16 +220,15 @@ def create_server():
             version: 聖經版本代碼（預設：unv）
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await get_bible_chapter(
+        return await _lookup_json(
+            get_bible_chapter,
             book=book,
             chapter=chapter,
             version=version,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def query_verse_citation_tool(
@@ -173,16 +246,15 @@ def create_server():
             include_strong: 是否包含 Strong's Number
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await query_verse_citation(
+        return await _lookup_json(
+            query_verse_citation,
             citation=citation,
             version=version,
             include_strong=include_strong,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     # ========================================================================
     # Search Tools
@@ -206,8 +278,7 @@ def create_server():
             limit: 最多返回筆數
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await search_bible(
             query=query,
@@ -216,7 +287,7 @@ def create_server():
             limit=limit,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def search_bible_advanced_tool(
@@ -242,8 +313,7 @@ def create_server():
             offset: 跳過筆數
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await search_bible_advanced(
             query=query,
@@ -255,7 +325,7 @@ def create_server():
             offset=offset,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     # ========================================================================
     # Strong's Number Tools
@@ -277,16 +347,15 @@ def create_server():
             verse: 節數
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await get_word_analysis(
+        return await _lookup_json(
+            get_word_analysis,
             book=book,
             chapter=chapter,
             verse=verse,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def lookup_strongs_tool(
@@ -302,15 +371,14 @@ def create_server():
             testament: 約別（OT=舊約, NT=新約）
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await lookup_strongs(
+        return await _lookup_json(
+            lookup_strongs,
             number=number,
             testament=testament,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def search_strongs_occurrences_tool(
@@ -328,8 +396,7 @@ def create_server():
             limit: 最多返回筆數
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await search_strongs_occurrences(
             strongs_number=strongs_number,
@@ -337,7 +404,7 @@ def create_server():
             limit=limit,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     # ========================================================================
     # Commentary Tools
@@ -361,8 +428,7 @@ def create_server():
             commentary_id: 註釋書 ID（可選）
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await get_commentary(
             book=book,
@@ -371,7 +437,7 @@ def create_server():
             commentary_id=commentary_id,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def list_commentaries_tool(
@@ -379,11 +445,9 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """列出所有可用的註釋書。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await list_commentaries(use_simplified=use_simplified)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return await _list_json(list_commentaries, use_simplified=use_simplified)
 
     @server.tool()
     async def search_commentary_tool(
@@ -401,8 +465,7 @@ def create_server():
             limit: 最多返回筆數
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await search_commentary(
             keyword=keyword,
@@ -410,7 +473,7 @@ def create_server():
             limit=limit,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def get_topic_study_tool(
@@ -428,8 +491,7 @@ def create_server():
             count_only: 是否只返回總數
             use_simplified: 是否使用簡體中文
         """
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await get_topic_study(
             keyword=keyword,
@@ -437,7 +499,7 @@ def create_server():
             count_only=count_only,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     # ========================================================================
     # Bible Info Tools
@@ -449,11 +511,9 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """列出所有可用的聖經版本。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await list_bible_versions(use_simplified=use_simplified)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return await _list_json(list_bible_versions, use_simplified=use_simplified)
 
     @server.tool()
     async def search_available_versions_tool(
@@ -463,15 +523,14 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """搜尋符合條件的聖經版本。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await search_available_versions(
             testament=testament,
             has_strongs=has_strongs,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def get_book_list_tool(
@@ -480,14 +539,13 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """取得書卷列表。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await get_book_list(
+        return await _list_json(
+            get_book_list,
             category=category,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def get_book_info_tool(
@@ -497,15 +555,14 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """取得特定書卷的詳細資訊。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await get_book_info(
             book=book,
             category=category,
             use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     # ========================================================================
     # Audio Bible Tools
@@ -519,13 +576,12 @@ def create_server():
     ) -> str:
         """取得有聲聖經音訊連結。"""
         result = await get_audio_bible(book=book, chapter=chapter, version=version)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def list_audio_versions_tool() -> str:
         """列出所有可用的有聲聖經版本。"""
-        result = await list_audio_versions()
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return await _list_json(list_audio_versions)
 
     @server.tool()
     async def get_audio_chapter_with_text_tool(
@@ -536,13 +592,12 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """取得有聲聖經章節及對應經文。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await get_audio_chapter_with_text(
             book=book, chapter=chapter, version=version, use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     # ========================================================================
     # Apocrypha Tools
@@ -557,13 +612,10 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """查詢次經 (Apocrypha) 經文內容。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
-            
-        result = await handle_get_apocrypha_verse(
-            book=book, chapter=chapter, verse=verse, use_simplified=use_simplified
+        # 次經 API 只提供 1933 年聖公會譯本，不分繁簡
+        return await _lookup_json(
+            http_get_apocrypha_verse, book=book, chapter=chapter, verse=verse
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def search_apocrypha_tool(
@@ -574,13 +626,12 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """在次經中搜尋關鍵字。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await handle_search_apocrypha(
             keyword=keyword, book=book, limit=limit, use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def list_apocrypha_books_tool(
@@ -588,11 +639,8 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """列出所有次經書卷。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
-            
-        result = await handle_list_apocrypha_books(use_simplified=use_simplified)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        # 書卷列表為固定資料，不分繁簡
+        return await _list_json(http_list_apocrypha_books)
 
     # ========================================================================
     # Apostolic Fathers Tools
@@ -607,13 +655,10 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """查詢使徒教父文獻。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
-            
-        result = await handle_get_apostolic_fathers_verse(
-            book=book, chapter=chapter, verse=verse, use_simplified=use_simplified
+        # 使徒教父 API 只提供單一中文譯本，不分繁簡
+        return await _lookup_json(
+            http_get_apostolic_fathers_verse, book=book, chapter=chapter, verse=verse
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     @server.tool()
     async def search_apostolic_fathers_tool(
@@ -624,13 +669,12 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """在使徒教父文獻中搜尋關鍵字。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
         result = await handle_search_apostolic_fathers(
             keyword=keyword, book=book, limit=limit, use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def list_apostolic_fathers_books_tool(
@@ -638,11 +682,8 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """列出所有使徒教父文獻書卷。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
-            
-        result = await handle_list_apostolic_fathers_books(use_simplified=use_simplified)
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        # 書卷列表為固定資料，不分繁簡
+        return await _list_json(http_list_apostolic_fathers_books)
 
     # ========================================================================
     # Footnotes Tool
@@ -656,13 +697,12 @@ def create_server():
         ctx: Context = None
     ) -> str:
         """查詢聖經經文註腳（僅限 TCV 現代中文譯本）。"""
-        if ctx and hasattr(ctx, 'session_config') and ctx.session_config:
-            use_simplified = getattr(ctx.session_config, 'use_simplified', use_simplified)
+        use_simplified = _resolve_simplified(ctx, use_simplified)
             
-        result = await handle_get_bible_footnote(
+        return await _lookup_json(
+            http_get_bible_footnote,
             book_id=book_id, footnote_id=footnote_id, use_simplified=use_simplified
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
 
     # ========================================================================
     # FHL Articles Tools
@@ -682,12 +722,11 @@ def create_server():
             keyword=keyword, title=title, author=author,
             column=column, limit=limit, offset=offset
         )
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return to_json(result)
 
     @server.tool()
     async def list_fhl_article_columns_tool() -> str:
         """列出信望愛網站所有文章專欄。"""
-        result = await handle_list_article_columns()
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return await _list_json(http_list_article_columns)
 
     return server
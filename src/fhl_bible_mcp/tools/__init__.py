@@ -4,48 +4,36 @@ MCP Tools 模組
 提供所有 FHL Bible MCP Server 的工具函數。
 """
 
-# 經文查詢工具
-from .verse import (
-    get_bible_verse,
-    get_bible_chapter,
-    query_verse_citation,
-)
+from importlib import import_module
 
-# 搜尋工具
-from .search import (
-    search_bible,
-    search_bible_advanced,
-)
-
-# 原文研究工具
-from .strongs import (
-    get_word_analysis,
-    lookup_strongs,
-    search_strongs_occurrences,
-)
-
-# 註釋與研經工具
-from .commentary import (
-    get_commentary,
-    list_commentaries,
-    search_commentary,
-    get_topic_study,
-)
-
-# 資訊查詢工具
-from .info import (
-    list_bible_versions,
-    get_book_list,
-    get_book_info,
-    search_available_versions,
-)
-
-# 多媒體工具
-from .audio import (
-    get_audio_bible,
-    list_audio_versions,
-    get_audio_chapter_with_text,
-)
+# 工具函數與所屬子模組的對照表，第一次存取時才匯入子模組（PEP 562）
+_TOOL_MODULES = {
+    # 經文查詢工具
+    "get_bible_verse": ".verse",
+    "get_bible_chapter": ".verse",
+    "query_verse_citation": ".verse",
+    # 搜尋工具
+    "search_bible": ".search",
+    "search_bible_advanced": ".search",
+    # 原文研究工具
+    "get_word_analysis": ".strongs",
+    "lookup_strongs": ".strongs",
+    "search_strongs_occurrences": ".strongs",
+    # 註釋與研經工具
+    "get_commentary": ".commentary",
+    "list_commentaries": ".commentary",
+    "search_commentary": ".commentary",
+    "get_topic_study": ".commentary",
+    # 資訊查詢工具
+    "list_bible_versions": ".info",
+    "get_book_list": ".info",
+    "get_book_info": ".info",
+    "search_available_versions": ".info",
+    # 多媒體工具
+    "get_audio_bible": ".audio",
+    "list_audio_versions": ".audio",
+    "get_audio_chapter_with_text": ".audio",
+}
 
 __all__ = [
     # 經文查詢
@@ -75,3 +63,16 @@ __all__ = [
     "get_audio_chapter_with_text",
 ]
 
+
+def __getattr__(name: str):
+    """延遲匯入工具函數"""
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
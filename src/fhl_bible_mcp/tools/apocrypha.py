@@ -8,6 +8,7 @@ import logging
 from typing import Any
 
 from fhl_bible_mcp.api.endpoints import FHLAPIEndpoints
+from fhl_bible_mcp.utils.serialization import to_json
 
 logger = logging.getLogger(__name__)
 
@@ -199,8 +200,7 @@ async def handle_get_apocrypha_verse(
                 "verses": verses
             }
             
-            import json
-            response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+            response = f"```json\n{to_json(response_data)}\n```"
             
             return [{"type": "text", "text": response}]
         else:
@@ -277,8 +277,7 @@ async def handle_search_apocrypha(
                 "results": results
             }
             
-            import json
-            response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+            response = f"```json\n{to_json(response_data)}\n```"
             
             return [{"type": "text", "text": response}]
         else:
@@ -333,8 +332,7 @@ async def handle_list_apocrypha_books(
             "books": books_list
         }
         
-        import json
-        response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+        response = f"```json\n{to_json(response_data)}\n```"
         return [{"type": "text", "text": response}]
         
     except Exception as e:
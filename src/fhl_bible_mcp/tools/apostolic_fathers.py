@@ -8,6 +8,7 @@ import logging
 from typing import Any
 
 from fhl_bible_mcp.api.endpoints import FHLAPIEndpoints
+from fhl_bible_mcp.utils.serialization import to_json
 
 logger = logging.getLogger(__name__)
 
@@ -200,8 +201,7 @@ async def handle_get_apostolic_fathers_verse(
                 "verses": verses
             }
             
-            import json
-            response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+            response = f"```json\n{to_json(response_data)}\n```"
             
             return [{"type": "text", "text": response}]
         else:
@@ -278,8 +278,7 @@ async def handle_search_apostolic_fathers(
                 "results": results
             }
             
-            import json
-            response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+            response = f"```json\n{to_json(response_data)}\n```"
             
             return [{"type": "text", "text": response}]
         else:
@@ -334,8 +333,7 @@ async def handle_list_apostolic_fathers_books(
             "books": books_list
         }
         
-        import json
-        response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+        response = f"```json\n{to_json(response_data)}\n```"
         return [{"type": "text", "text": response}]
         
     except Exception as e:
@@ -9,6 +9,10 @@ from typing import Any
 from mcp.types import TextContent
 
 from fhl_bible_mcp.api.endpoints import FHLAPIEndpoints
+from fhl_bible_mcp.utils.serialization import to_json
+
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
 
 
 def get_articles_tool_definitions() -> list[dict[str, Any]]:
@@ -141,8 +145,7 @@ async def handle_search_articles(
                     "query_type": "article_search",
                     "message": "未找到符合條件的文章"
                 }
-                import json
-                response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+                response = f"```json\n{to_json(response_data)}\n```"
                 return [TextContent(type="text", text=response)]
             
             # Check if full content is requested
@@ -175,9 +178,9 @@ async def handle_search_articles(
                     preview = ""
                     if content:
                         # Simple HTML tag removal
-                        clean_content = re.sub(r'<[^>]+>', '', content)
+                        clean_content = _HTML_TAG_PATTERN.sub('', content)
                         # Remove extra whitespace
-                        clean_content = re.sub(r'\s+', ' ', clean_content).strip()
+                        clean_content = _WHITESPACE_PATTERN.sub(' ', clean_content).strip()
                         
                         preview_length = 200
                         if len(clean_content) > preview_length:
@@ -198,8 +201,7 @@ async def handle_search_articles(
                 "articles": article_list
             }
             
-            import json
-            response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+            response = f"```json\n{to_json(response_data)}\n```"
             
             # Add helpful notes
             if include_content:
@@ -266,8 +268,7 @@ async def handle_search_articles(
                 "query_type": "article_search",
                 "message": "未找到符合條件的文章"
             }
-            import json
-            response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+            response = f"```json\n{to_json(response_data)}\n```"
             return [TextContent(type="text", text=response)]
     
     except Exception as e:
@@ -299,8 +300,7 @@ async def handle_list_article_columns(
         ]
     }
     
-    import json
-    response = f"```json\n{json.dumps(response_data, ensure_ascii=False, indent=2)}\n```"
+    response = f"```json\n{to_json(response_data)}\n```"
     
     # Add usage examples
     notes = [
@@ -4,6 +4,7 @@
 提供有聲聖經查詢的 MCP 工具函數。
 """
 
+import asyncio
 from typing import Optional, Dict, Any, List
 from ..api.endpoints import FHLAPIEndpoints
 from ..utils.booknames import BookNameConverter
@@ -60,7 +61,8 @@ async def get_audio_bible(
         InvalidParameterError: 參數錯誤
     """
     # 驗證音檔版本
-    if audio_version not in AUDIO_VERSIONS:
+    version_info = AUDIO_VERSIONS.get(audio_version)
+    if version_info is None:
         raise InvalidParameterError(
             f"無效的有聲聖經版本: {audio_version}，"
             f"可用版本: {', '.join(AUDIO_VERSIONS.keys())}"
@@ -71,7 +73,7 @@ async def get_audio_bible(
     if not book_id:
         raise InvalidParameterError(f"找不到書卷: {book}")
 
-    version_id = AUDIO_VERSIONS[audio_version]["id"]
+    version_id = version_info["id"]
 
     # 呼叫 API
     async with FHLAPIEndpoints() as api:
@@ -164,22 +166,22 @@ async def get_audio_chapter_with_text(
     Returns:
         包含音檔與經文的字典
     """
-    # 取得音檔資訊
-    audio_info = await get_audio_bible(
-        book=book,
-        chapter=chapter,
-        audio_version=audio_version,
-        use_simplified=use_simplified,
-    )
-
-    # 取得經文內容
     from .verse import get_bible_chapter
 
-    verse_info = await get_bible_chapter(
-        book=book,
-        chapter=chapter,
-        version=text_version,
-        use_simplified=use_simplified,
+    # 音檔與經文互不相依，同時查詢
+    audio_info, verse_info = await asyncio.gather(
+        get_audio_bible(
+            book=book,
+            chapter=chapter,
+            audio_version=audio_version,
+            use_simplified=use_simplified,
+        ),
+        get_bible_chapter(
+            book=book,
+            chapter=chapter,
+            version=text_version,
+            use_simplified=use_simplified,
+        ),
     )
 
     return {
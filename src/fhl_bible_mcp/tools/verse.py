@@ -4,11 +4,15 @@
 提供查詢聖經經文的 MCP 工具函數。
 """
 
+import re
 from typing import Optional, Dict, Any, List
 from ..api.endpoints import FHLAPIEndpoints
 from ..utils.booknames import BookNameConverter
 from ..utils.errors import BookNotFoundError, InvalidParameterError
 
+# 經文引用格式：書卷 章:節、書卷 章:節-節 或 書卷 章:節,節（模組載入時編譯一次）
+_CITATION_PATTERN = re.compile(r"^(.+?)\s+(\d+):(\d+(?:-\d+|,\d+)*)$")
+
 
 async def get_bible_verse(
     book: str,
@@ -142,11 +146,7 @@ async def query_verse_citation(
         InvalidParameterError: 引用格式錯誤
     """
     # 解析引用字串（簡單實作，可以後續增強）
-    import re
-
-    # 匹配格式：書卷 章:節 或 書卷 章:節-節
-    pattern = r"^(.+?)\s+(\d+):(\d+(?:-\d+|,\d+)*)$"
-    match = re.match(pattern, citation.strip())
+    match = _CITATION_PATTERN.match(citation.strip())
 
     if not match:
         raise InvalidParameterError("citation", citation, "無效的經文引用格式")
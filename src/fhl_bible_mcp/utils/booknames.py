@@ -4,10 +4,15 @@
 提供聖經書卷的中英文名稱轉換、書卷編號查詢、繁簡轉換、容錯查找等功能。
 """
 
+from functools import lru_cache
 from typing import Dict, Optional, Tuple, List
 import re
 
 
+# 經文引用格式："書卷名 章:節" 或 "書卷名 章:節-節"
+_REFERENCE_PATTERN = re.compile(r'^(.+?)\s*(\d+):(\d+)(?:-(\d+))?$')
+
+
 # 聖經書卷對照表 (編號, 英文縮寫, 英文全名, 中文簡寫, 中文全名)
 BIBLE_BOOKS = [
     # 舊約 (1-39)
@@ -131,6 +136,10 @@ SIMPLIFIED_TO_TRADITIONAL = {
 
 TRADITIONAL_TO_SIMPLIFIED = {v: k for k, v in SIMPLIFIED_TO_TRADITIONAL.items()}
 
+# str.translate 對照表（碼位 -> 碼位），轉換在 C 層逐字完成
+_S2T_TABLE = str.maketrans(SIMPLIFIED_TO_TRADITIONAL)
+_T2S_TABLE = str.maketrans(TRADITIONAL_TO_SIMPLIFIED)
+
 # 書卷別名和縮寫
 BOOK_ALIASES = {
     # 創世記
@@ -311,6 +320,13 @@ for book_id, eng_short, eng_full, chi_short, chi_full in BIBLE_BOOKS:
     _chi_short_to_info[chi_short] = (book_id, eng_short, eng_full, chi_full)
     _chi_full_to_info[chi_full] = (book_id, eng_short, eng_full, chi_short)
 
+# 所有書卷名稱（英文縮寫/全名已轉小寫、中文簡寫/全名）-> 書卷編號，查詢只需一次 dict lookup
+_name_to_book_id: Dict[str, int] = {
+    name: info[0]
+    for index in (_chi_full_to_info, _chi_short_to_info, _eng_full_to_info, _eng_short_to_info)
+    for name, info in index.items()
+}
+
 
 class BookNameConverter:
     """書卷名稱轉換工具類"""
@@ -340,25 +356,9 @@ class BookNameConverter:
                 return name
             return None
         
+        # 英文名稱不分大小寫，中文名稱直接查找
         name_lower = name.lower() if name.isascii() else name
-
-        # 嘗試英文縮寫
-        if name_lower in _eng_short_to_info:
-            return _eng_short_to_info[name_lower][0]
-
-        # 嘗試英文全名
-        if name_lower in _eng_full_to_info:
-            return _eng_full_to_info[name_lower][0]
-
-        # 嘗試中文簡寫
-        if name in _chi_short_to_info:
-            return _chi_short_to_info[name][0]
-
-        # 嘗試中文全名
-        if name in _chi_full_to_info:
-            return _chi_full_to_info[name][0]
-
-        return None
+        return _name_to_book_id.get(name_lower)
 
     @staticmethod
     def get_english_short(name: str) -> Optional[str]:
@@ -528,10 +528,7 @@ class BookNameConverter:
         Returns:
             繁體中文文字
         """
-        result = []
-        for char in text:
-            result.append(SIMPLIFIED_TO_TRADITIONAL.get(char, char))
-        return "".join(result)
+        return text.translate(_S2T_TABLE)
 
     @staticmethod
     def traditional_to_simplified(text: str) -> str:
@@ -544,16 +541,16 @@ class BookNameConverter:
         Returns:
             簡體中文文字
         """
-        result = []
-        for char in text:
-            result.append(TRADITIONAL_TO_SIMPLIFIED.get(char, char))
-        return "".join(result)
+        return text.translate(_T2S_TABLE)
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def normalize_book_name(name: str) -> Optional[str]:
         """
         標準化書卷名稱,支援各種別名和縮寫
         
+        結果會被快取（純函數，輸入值域很小），重複查詢同一名稱只需一次查找。
+        
         Args:
             name: 書卷名稱 (可以是別名、縮寫、英文、簡體等)
             
@@ -754,8 +751,7 @@ class BookNameConverter:
         
         # 嘗試匹配 "書卷名 章:節" 或 "書卷名 章:節-節" 格式
         # 支援中英文書卷名
-        pattern = r'^(.+?)\s*(\d+):(\d+)(?:-(\d+))?$'
-        match = re.match(pattern, reference)
+        match = _REFERENCE_PATTERN.match(reference)
         
         if match:
             book_name = match.group(1).strip()
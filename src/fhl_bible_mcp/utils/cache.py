@@ -2,16 +2,23 @@
 Cache System for FHL Bible MCP Server
 
 提供檔案快取功能，支援 TTL (Time To Live) 過期策略。
+另提供行程內的記憶體 LRU 快取（MemoryCache / memory_cached），
+用於快取工具函數的結果，避免重複的上游 API 請求；
+以及 single_flight，讓同時進行中的相同呼叫共用同一個上游請求。
 """
 
-import json
+import asyncio
 import hashlib
 import time
+import functools
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Callable, Hashable, Optional, Dict, List, Tuple
 from datetime import datetime, timedelta
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,7 +154,7 @@ class FileCache:
             "errors": 0
         }
         
-        logger.info(f"FileCache initialized: cache_dir={self.cache_dir.absolute()}")
+        logger.info("FileCache initialized: cache_dir=%s", self.cache_dir.absolute())
     
     def _get_cache_key(self, namespace: str, key: str) -> str:
         """
@@ -198,25 +205,24 @@ class FileCache:
         
         if not cache_file.exists():
             self.stats["misses"] += 1
-            logger.debug(f"Cache miss: {cache_key}")
+            logger.debug("Cache miss: %s", cache_key)
             return None
         
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cached_data = json.load(f)
+            cached_data = orjson.loads(cache_file.read_bytes())
             
             entry = CacheEntry.from_dict(cached_data)
             
             # 檢查是否過期
             if not entry.is_valid():
                 self.stats["misses"] += 1
-                logger.debug(f"Cache expired: {cache_key}")
+                logger.debug("Cache expired: %s", cache_key)
                 # 刪除過期的快取
                 cache_file.unlink()
                 return None
             
             self.stats["hits"] += 1
-            logger.debug(f"Cache hit: {cache_key}")
+            logger.debug("Cache hit: %s", cache_key)
             return entry.data
             
         except Exception as e:
@@ -260,11 +266,10 @@ class FileCache:
             )
             
             # 寫入檔案
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(entry.to_dict(), f, ensure_ascii=False, indent=2)
+            cache_file.write_bytes(orjson.dumps(entry.to_dict()))
             
             self.stats["writes"] += 1
-            logger.debug(f"Cache written: {cache_key} (strategy={strategy_name})")
+            logger.debug("Cache written: %s (strategy=%s)", cache_key, strategy_name)
             return True
             
         except Exception as e:
@@ -292,7 +297,7 @@ class FileCache:
         try:
             cache_file.unlink()
             self.stats["deletes"] += 1
-            logger.debug(f"Cache deleted: {cache_key}")
+            logger.debug("Cache deleted: %s", cache_key)
             return True
         except Exception as e:
             self.stats["errors"] += 1
@@ -315,8 +320,7 @@ class FileCache:
             for cache_file in self.cache_dir.glob("*.json"):
                 try:
                     # 讀取快取檔案以取得命名空間
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        cached_data = json.load(f)
+                    cached_data = orjson.loads(cache_file.read_bytes())
                     
                     cache_key = cached_data.get("key", "")
                     
@@ -333,7 +337,7 @@ class FileCache:
                     logger.error(f"Error clearing cache file {cache_file}: {e}")
                     self.stats["errors"] += 1
             
-            logger.info(f"Cache cleared: {cleared} items (namespace={namespace})")
+            logger.info("Cache cleared: %s items (namespace=%s)", cleared, namespace)
             return cleared
             
         except Exception as e:
@@ -353,8 +357,7 @@ class FileCache:
         try:
             for cache_file in self.cache_dir.glob("*.json"):
                 try:
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        cached_data = json.load(f)
+                    cached_data = orjson.loads(cache_file.read_bytes())
                     
                     entry = CacheEntry.from_dict(cached_data)
                     
@@ -362,13 +365,13 @@ class FileCache:
                     if not entry.is_valid():
                         cache_file.unlink()
                         cleaned += 1
-                        logger.debug(f"Cleaned expired cache: {entry.key}")
+                        logger.debug("Cleaned expired cache: %s", entry.key)
                     
                 except Exception as e:
                     logger.error(f"Error cleaning cache file {cache_file}: {e}")
                     self.stats["errors"] += 1
             
-            logger.info(f"Cleanup completed: {cleaned} expired items removed")
+            logger.info("Cleanup completed: %s expired items removed", cleaned)
             return cleaned
             
         except Exception as e:
@@ -394,8 +397,7 @@ class FileCache:
         
         for cache_file in self.cache_dir.glob("*.json"):
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cached_data = json.load(f)
+                cached_data = orjson.loads(cache_file.read_bytes())
                 
                 cache_key = cached_data.get("key", "")
                 namespace = cache_key.split(":", 1)[0] if ":" in cache_key else "unknown"
@@ -441,8 +443,7 @@ class FileCache:
         
         for cache_file in self.cache_dir.glob("*.json"):
             try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cached_data = json.load(f)
+                cached_data = orjson.loads(cache_file.read_bytes())
                 
                 cache_key = cached_data.get("key", "")
                 
@@ -497,3 +498,188 @@ def reset_cache() -> None:
     """重置全域快取實例（主要用於測試）"""
     global _global_cache
     _global_cache = None
+
+
+# ============================================================================
+# 記憶體快取
+# ============================================================================
+
+_MISSING = object()
+
+
+def _call_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """以位置參數與關鍵字參數組成呼叫鍵"""
+    return (args, tuple(sorted(kwargs.items())))
+
+
+class MemoryCache:
+    """行程內 LRU 快取，支援 TTL 過期"""
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: Optional[int] = None):
+        """
+        初始化記憶體快取
+
+        Args:
+            maxsize: 最多保留的項目數，超過時淘汰最久未使用的項目
+            ttl_seconds: 快取存活時間（秒），None 表示永久快取
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        取得快取資料
+
+        Args:
+            key: 快取鍵
+            default: 找不到或已過期時的返回值
+
+        Returns:
+            快取資料，若不存在或已過期則返回 default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        設定快取資料
+
+        Args:
+            key: 快取鍵
+            value: 快取資料
+        """
+        expires_at = None
+        if self.ttl_seconds is not None:
+            expires_at = time.monotonic() + self.ttl_seconds
+
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """清除所有快取"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        取得快取統計資訊
+
+        Returns:
+            包含 size, maxsize, ttl_seconds, hits, misses 的字典
+        """
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def memory_cached(
+    maxsize: int = 1024,
+    ttl_seconds: Optional[int] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    非同步函數的記憶體快取裝飾器
+
+    以呼叫參數作為快取鍵，只快取成功的結果（拋出例外時不快取）。
+    參數無法雜湊時直接呼叫原函數。快取實例可透過 wrapper.cache 取得。
+
+    Args:
+        maxsize: 最多保留的項目數
+        ttl_seconds: 快取存活時間（秒），None 表示永久快取
+
+    Returns:
+        裝飾器
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = MemoryCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _call_key(args, kwargs)
+            try:
+                value = cache.get(key, _MISSING)
+            except TypeError:
+                # 參數無法雜湊（如 list / dict），不使用快取
+                return await func(*args, **kwargs)
+
+            if value is _MISSING:
+                value = await func(*args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+# 工具結果快取的共用設定（stdio、HTTP、Smithery 三個入口共用同一組參數）：
+# 經文、原文、註腳等查詢結果不會改變；目錄類列表（版本、註釋書、書卷）幾乎不變，保留較久。
+# 每個被裝飾的函數各自擁有獨立的 MemoryCache。
+lookup_cached = memory_cached(maxsize=4096, ttl_seconds=3600)
+list_cached = memory_cached(maxsize=64, ttl_seconds=86400)
+
+
+def single_flight(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    非同步函數的 single-flight 裝飾器
+
+    相同參數的呼叫若已在進行中，直接等待同一個結果，而不是再發出一次上游請求。
+    呼叫完成後即移除，不保留結果（需要快取時搭配 memory_cached）。
+    某個等待者被取消不會中斷其他等待者共用的呼叫。
+    參數無法雜湊時直接呼叫原函數。進行中的呼叫可透過 wrapper.inflight 取得。
+
+    Args:
+        func: 要包裝的非同步函數
+
+    Returns:
+        包裝後的函數
+    """
+    inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def finish(key: Hashable, task: "asyncio.Future[Any]") -> None:
+        inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # 避免 "exception was never retrieved" 警告
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _call_key(args, kwargs)
+        try:
+            task = inflight.get(key)
+        except TypeError:
+            # 參數無法雜湊（如 list / dict），不合併呼叫
+            return await func(*args, **kwargs)
+
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            inflight[key] = task
+            task.add_done_callback(functools.partial(finish, key))
+        return await asyncio.shield(task)
+
+    wrapper.inflight = inflight
+    return wrapper
@@ -0,0 +1,61 @@
+"""
+JSON Serialization for FHL Bible MCP Server
+
+以 orjson 產生工具回傳的 JSON 文字。orjson 直接輸出 UTF-8，
+中文經文、註釋等內容不需逐字元判斷是否轉義，比標準庫 json 快得多。
+
+工具回傳給 MCP 客戶端（程式）讀取，預設輸出精簡 JSON；
+需要人工閱讀時可設定環境變數 FHL_JSON_INDENT=true 改為 2 格縮排。
+"""
+
+import functools
+import os
+from typing import Any, Optional
+
+import orjson
+
+# 預先綁定選項的 orjson.dumps（模組層級共用，不必每次呼叫建立參數）
+_dumps_indented = functools.partial(
+    orjson.dumps, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+)
+_dumps_compact = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+
+# 是否預設縮排（啟動時讀取一次）
+JSON_INDENT = os.getenv("FHL_JSON_INDENT", "").lower() in ('true', '1', 'yes', 'on')
+
+
+def to_json(obj: Any, indent: Optional[bool] = None) -> str:
+    """
+    將物件序列化為 JSON 文字
+
+    縮排輸出與 json.dumps(obj, ensure_ascii=False, indent=2) 相同，
+    精簡輸出與 to_compact_json 相同。非字串的 dict 鍵（如 int）會轉為字串。
+
+    Args:
+        obj: 要序列化的物件
+        indent: 是否使用 2 格縮排，None 表示依 FHL_JSON_INDENT 設定（預設不縮排）
+
+    Returns:
+        JSON 文字
+    """
+    if indent is None:
+        indent = JSON_INDENT
+    if indent:
+        return _dumps_indented(obj).decode("utf-8")
+    return _dumps_compact(obj).decode("utf-8")
+
+
+def to_compact_json(obj: Any) -> str:
+    """
+    將物件序列化為精簡（無空白）的 JSON 文字
+
+    輸出與 json.dumps(obj, ensure_ascii=False, separators=(",", ":")) 相同，
+    非字串的 dict 鍵（如 int）會轉為字串。
+
+    Args:
+        obj: 要序列化的物件
+
+    Returns:
+        JSON 文字
+    """
+    return _dumps_compact(obj).decode("utf-8")
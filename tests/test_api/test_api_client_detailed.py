@@ -6,12 +6,17 @@ Unit tests for API client
 import sys
 import pytest
 import httpx
+import orjson
 from unittest.mock import AsyncMock, patch, MagicMock
 
 # Add src to path so we can import without src. prefix
 sys.path.insert(0, 'src')
 
-from fhl_bible_mcp.api.client import FHLAPIClient
+from fhl_bible_mcp.api.client import (
+    FHLAPIClient,
+    create_http_client,
+    set_shared_http_client,
+)
 from fhl_bible_mcp.utils.errors import (
     NetworkError,
     APIResponseError,
@@ -54,7 +59,7 @@ async def test_make_request_success_json():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"status": "success", "data": "test"}
+    mock_response.content = orjson.dumps({"status": "success", "data": "test"})
     
     client = FHLAPIClient()
     
@@ -92,7 +97,7 @@ async def test_make_request_api_error_response():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"status": "error", "message": "Invalid query"}
+    mock_response.content = orjson.dumps({"status": "error", "message": "Invalid query"})
     
     client = FHLAPIClient()
     
@@ -143,7 +148,7 @@ async def test_make_request_json_parse_error():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.side_effect = ValueError("Invalid JSON")
+    mock_response.content = b"Not valid JSON"
     mock_response.text = "Not valid JSON"
     
     client = FHLAPIClient()
@@ -167,7 +172,7 @@ async def test_make_request_timeout_with_retry():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"status": "success"}
+    mock_response.content = orjson.dumps({"status": "success"})
     
     with patch.object(client._client, 'get') as mock_get:
         mock_get.side_effect = [
@@ -206,7 +211,7 @@ async def test_make_request_network_error_with_retry():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"status": "success"}
+    mock_response.content = orjson.dumps({"status": "success"})
     
     with patch.object(client._client, 'get') as mock_get:
         mock_get.side_effect = [
@@ -254,7 +259,7 @@ async def test_make_request_default_gb_parameter():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"status": "success"}
+    mock_response.content = orjson.dumps({"status": "success"})
     
     client = FHLAPIClient(gb=1)
     
@@ -343,7 +348,7 @@ async def test_retry_request_exponential_backoff():
     mock_response = MagicMock()
     mock_response.status_code = 200
     mock_response.headers = {"content-type": "application/json"}
-    mock_response.json.return_value = {"status": "success"}
+    mock_response.content = orjson.dumps({"status": "success"})
     
     sleep_times = []
     
@@ -374,3 +379,55 @@ async def test_client_base_url_strip_trailing_slash():
     assert client.base_url == "https://api.test.com"
     
     await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_uses_shared_http_client():
+    """測試設定共用連線池後，客戶端重用同一個 AsyncClient 且不會關閉它"""
+    shared = create_http_client()
+    set_shared_http_client(shared)
+    try:
+        async with FHLAPIClient() as first, FHLAPIClient() as second:
+            assert first._client is shared
+            assert second._client is shared
+        
+        assert not shared.is_closed
+    finally:
+        set_shared_http_client(None)
+        await shared.aclose()
+    
+    # 共用連線池移除後，客戶端建立並擁有自己的連線
+    client = FHLAPIClient()
+    assert client._client is not shared
+    await client.close()
+    assert client._client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_endpoints_reuses_shared_instance():
+    """測試設定共用 FHLAPIEndpoints 後，get_endpoints 回傳同一個實例且離開 async with 不會關閉連線池"""
+    from fhl_bible_mcp.api.endpoints import (
+        FHLAPIEndpoints,
+        get_endpoints,
+        set_shared_endpoints,
+    )
+    
+    shared = create_http_client()
+    set_shared_http_client(shared)
+    endpoints = FHLAPIEndpoints(use_cache=False)
+    set_shared_endpoints(endpoints)
+    try:
+        async with get_endpoints() as first:
+            assert first is endpoints
+        async with get_endpoints() as second:
+            assert second is endpoints
+        
+        assert not shared.is_closed
+    finally:
+        set_shared_endpoints(None)
+        set_shared_http_client(None)
+        await shared.aclose()
+    
+    # 未設定共用實例時，每次建立新的實例
+    async with get_endpoints() as api:
+        assert api is not endpoints
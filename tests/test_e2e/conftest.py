@@ -2,6 +2,7 @@
 E2E 測試的 pytest fixtures 和設定
 """
 import sys
+import orjson
 import pytest
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -30,7 +31,7 @@ def mock_api_response():
         mock_response = MagicMock()
         mock_response.status_code = status_code
         mock_response.headers = {"content-type": "application/json"}
-        mock_response.json.return_value = data
+        mock_response.content = orjson.dumps(data)
         mock_response.text = str(data)
         return mock_response
     
@@ -0,0 +1,643 @@
+"""
+Test FHL Bible MCP HTTP Server
+
+Tests for the Smithery HTTP deployment: config middleware and helpers.
+"""
+
+import inspect
+
+import pytest
+from fhl_bible_mcp import http_server
+from fhl_bible_mcp.utils.cache import memory_cached
+
+
+async def _call_middleware(query_string: bytes) -> dict:
+    """透過 Smithery config middleware 執行一次請求，回傳 scope 中的設定"""
+    captured = {}
+
+    async def app(scope, receive, send):
+        captured.update(scope)
+        captured["request_config"] = http_server.get_request_config()
+
+    middleware = http_server.smithery_config_middleware(app)
+    await middleware({"type": "http", "query_string": query_string}, None, None)
+    assert captured["request_config"] == captured["smithery_config"]
+    return captured["smithery_config"]
+
+
+@pytest.mark.asyncio
+async def test_smithery_config_parsing():
+    """
+    Test 1: Smithery Config Parsing
+    測試 middleware 能從 query string 解析出 session 設定
+    """
+    print("\n" + "="*70)
+    print("Test 1: Smithery Config Parsing")
+    print("="*70)
+
+    config = await _call_middleware(b"use_simplified=true")
+    assert config == {"use_simplified": True}
+
+    config = await _call_middleware(b"")
+    assert config == {}
+
+    print("✅ Config parsed from query string")
+
+
+@pytest.mark.asyncio
+async def test_smithery_config_cached_per_query_string():
+    """
+    Test 2: Smithery Config Cache
+    測試相同 query string 只解析一次，且每次請求拿到獨立的 dict
+    """
+    print("\n" + "="*70)
+    print("Test 2: Smithery Config Cache")
+    print("="*70)
+
+    http_server._parse_config_cached.cache_clear()
+
+    first = await _call_middleware(b"use_simplified=false")
+    first["use_simplified"] = True  # 修改不應影響快取
+    second = await _call_middleware(b"use_simplified=false")
+
+    assert second == {"use_simplified": False}
+    info = http_server._parse_config_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+    print(f"✅ Cache info: {info}")
+
+
+@pytest.mark.asyncio
+async def test_smithery_config_invalid_query_string():
+    """
+    Test 3: Invalid Query String
+    測試無法解碼的 query string 不會中斷請求
+    """
+    print("\n" + "="*70)
+    print("Test 3: Invalid Query String")
+    print("="*70)
+
+    config = await _call_middleware(b"\xff\xfe")
+    assert config == {}
+
+    print("✅ Invalid query string falls back to empty config")
+
+
+def test_well_known_endpoints():
+    """
+    Test 4: Well-Known Endpoints
+    測試 Smithery 探索端點回傳預先序列化的 JSON
+    """
+    print("\n" + "="*70)
+    print("Test 4: Well-Known Endpoints")
+    print("="*70)
+
+    from starlette.testclient import TestClient
+
+    client = TestClient(http_server.create_http_app())
+
+    response = client.get("/.well-known/mcp-config")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == http_server.MCP_CONFIG
+
+    response = client.get("/.well-known/mcp/server-card.json")
+    assert response.status_code == 200
+    assert response.json() == http_server.SERVER_CARD
+
+    print("✅ Well-known endpoints return the expected documents")
+
+
+def test_health_check():
+    """
+    Test 5: Health Check
+    測試健康檢查端點
+    """
+    print("\n" + "="*70)
+    print("Test 5: Health Check")
+    print("="*70)
+
+    from starlette.testclient import TestClient
+
+    client = TestClient(http_server.create_http_app())
+
+    response = client.get("/health")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"status": "ok", "server": "FHL Bible MCP Server"}
+
+    response = client.head("/health")
+    assert response.status_code == 200
+    assert response.content == b""
+
+    print("✅ Health check OK")
+
+
+@pytest.mark.asyncio
+async def test_tools_registered():
+    """
+    Test 6: Tools Registration
+    測試 TOOLS 表中的工具全部註冊，且保留實作函數的參數
+    """
+    print("\n" + "="*70)
+    print("Test 6: Tools Registration")
+    print("="*70)
+
+    tools = await http_server.mcp.list_tools()
+    names = [tool.name for tool in tools]
+
+    assert names == [name for name, _, _ in http_server.TOOLS] + ["batch"]
+
+    verse_tool = next(tool for tool in tools if tool.name == "get_bible_verse")
+    assert verse_tool.inputSchema["required"] == ["book", "chapter"]
+    assert "Args:" in verse_tool.description
+
+    print(f"✅ {len(names)} tools registered")
+
+
+@pytest.mark.asyncio
+async def test_make_tool_serializes_result():
+    """
+    Test 7: Tool Result Serialization
+    測試工具回傳實作結果的 JSON 文字（保留中文字元）
+    """
+    print("\n" + "="*70)
+    print("Test 7: Tool Result Serialization")
+    print("="*70)
+
+    async def lookup(book: str, chapter: int = 1) -> dict:
+        return {"book": book, "chapter": chapter}
+
+    tool = http_server._make_tool("lookup_tool", lookup)
+
+    assert tool.__name__ == "lookup_tool"
+    assert list(inspect.signature(tool).parameters) == ["book", "chapter"]
+    assert await tool(book="約", chapter=3) == '{"book":"約","chapter":3}'
+
+    print("✅ Result serialized as compact JSON")
+
+
+@pytest.mark.asyncio
+async def test_request_config_context():
+    """
+    Test 8: Request Config Context
+    測試 get_request_config 只在請求期間回傳該請求的設定
+    """
+    print("\n" + "="*70)
+    print("Test 8: Request Config Context")
+    print("="*70)
+
+    assert http_server.get_request_config() == {}
+
+    config = await _call_middleware(b"use_simplified=true")
+    assert config == {"use_simplified": True}
+
+    # 請求結束後 context 已重置
+    assert http_server.get_request_config() == {}
+    assert http_server.get_config_value("use_simplified", False) is False
+
+    print("✅ Request config scoped to the request")
+
+
+@pytest.mark.asyncio
+async def test_make_tool_caches_serialized_result():
+    """
+    Test 9: Cached List Tool
+    測試列表類工具快取序列化後的 JSON 文字，重複呼叫不再呼叫實作函數
+    """
+    print("\n" + "="*70)
+    print("Test 9: Cached List Tool")
+    print("="*70)
+
+    calls = []
+
+    async def list_items(use_simplified: bool = False) -> dict:
+        calls.append(use_simplified)
+        return {"items": ["和合本"], "use_simplified": use_simplified}
+
+    tool = http_server._make_tool(
+        "list_items", list_items, cache=memory_cached(maxsize=4)
+    )
+
+    first = await tool()
+    second = await tool()
+    assert first == '{"items":["和合本"],"use_simplified":false}'
+    assert second is first
+    assert len(calls) == 1
+
+    await tool(use_simplified=True)
+    assert len(calls) == 2
+    assert set(http_server._TOOL_CACHES) <= {name for name, _, _ in http_server.TOOLS}
+
+    print("✅ Serialized result served from cache")
+
+
+def test_prebuilt_cors_middleware():
+    """
+    Test 10: CORS Middleware
+    測試預先建立標頭的 CORS middleware 與 Starlette CORSMiddleware 回應相同
+    """
+    print("\n" + "="*70)
+    print("Test 10: CORS Middleware")
+    print("="*70)
+
+    from starlette.applications import Starlette
+    from starlette.middleware.cors import CORSMiddleware
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+
+    async def endpoint(request):
+        return PlainTextResponse("ok", headers={"Vary": "Accept-Encoding"})
+
+    def build_app():
+        return Starlette(routes=[Route("/", endpoint, methods=["GET", "POST"])])
+
+    reference = build_app()
+    reference.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=http_server.CORS_ALLOW_METHODS,
+        allow_headers=["*"],
+        expose_headers=http_server.CORS_EXPOSE_HEADERS,
+        max_age=http_server.CORS_MAX_AGE,
+    )
+    reference_client = TestClient(reference)
+    client = TestClient(http_server.PrebuiltCORSMiddleware(build_app()))
+
+    origin = "https://example.com"
+    requests = [
+        ("OPTIONS", {"Origin": origin, "Access-Control-Request-Method": "POST"}),
+        ("OPTIONS", {
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type, mcp-session-id",
+        }),
+        ("OPTIONS", {"Origin": origin, "Access-Control-Request-Method": "DELETE"}),
+        ("OPTIONS", {
+            "Origin": origin,
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Private-Network": "true",
+        }),
+        ("OPTIONS", {
+            "Origin": origin,
+            "Access-Control-Request-Method": "DELETE",
+            "Access-Control-Request-Private-Network": "true",
+        }),
+        ("GET", {"Origin": origin}),
+        ("POST", {"Origin": origin}),
+        ("GET", {}),
+    ]
+    for method, headers in requests:
+        expected = reference_client.request(method, "/", headers=headers)
+        response = client.request(method, "/", headers=headers)
+        assert response.status_code == expected.status_code
+        assert response.text == expected.text
+        assert dict(response.headers) == dict(expected.headers)
+
+    # The deployed app answers preflights before reaching the MCP stack
+    response = TestClient(http_server.create_http_app()).options("/", headers=requests[0][1])
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == origin
+
+    print("✅ CORS responses match CORSMiddleware")
+
+
+def test_settings_from_env(monkeypatch):
+    """
+    Test 11: Settings From Environment
+    測試部署設定由環境變數一次解析
+    """
+    print("\n" + "="*70)
+    print("Test 11: Settings From Environment")
+    print("="*70)
+
+    names = (
+        "TRANSPORT", "PORT", "WORKERS", "UVICORN_LOG_LEVEL", "MCP_JSON_RESPONSE",
+        "UVICORN_LIMIT_CONCURRENCY", "UVICORN_BACKLOG", "UVICORN_TIMEOUT_KEEP_ALIVE",
+        "UVICORN_LIMIT_MAX_REQUESTS",
+    )
+    for name in names:
+        monkeypatch.delenv(name, raising=False)
+    assert http_server.HTTPSettings.from_env() == http_server.HTTPSettings()
+
+    monkeypatch.setenv("TRANSPORT", "stdio")
+    monkeypatch.setenv("PORT", "9000")
+    monkeypatch.setenv("WORKERS", "0")
+    monkeypatch.setenv("UVICORN_LOG_LEVEL", "WARNING")
+    monkeypatch.setenv("MCP_JSON_RESPONSE", "true")
+    monkeypatch.setenv("UVICORN_LIMIT_CONCURRENCY", "0")
+    monkeypatch.setenv("UVICORN_BACKLOG", "512")
+    monkeypatch.setenv("UVICORN_TIMEOUT_KEEP_ALIVE", "5")
+    monkeypatch.setenv("UVICORN_LIMIT_MAX_REQUESTS", "0")
+    settings = http_server.HTTPSettings.from_env()
+    assert settings == http_server.HTTPSettings(
+        transport="stdio", port=9000, workers=1, log_level="warning", json_response=True,
+        limit_concurrency=0, backlog=512, timeout_keep_alive=5, limit_max_requests=0,
+    )
+
+    with pytest.raises(AttributeError):
+        settings.port = 8081
+
+    print(f"✅ Settings: {settings}")
+
+
+@pytest.mark.asyncio
+async def test_warm_up_tools(monkeypatch):
+    """
+    Test 12: Tool Warm-up
+    測試啟動時預先呼叫列表類工具，且單一工具失敗不影響其他工具
+    """
+    print("\n" + "="*70)
+    print("Test 12: Tool Warm-up")
+    print("="*70)
+
+    called = []
+
+    async def fake_call_tool(name, arguments):
+        called.append((name, arguments))
+        if name == "list_commentaries":
+            raise RuntimeError("upstream unreachable")
+        return []
+
+    monkeypatch.setattr(http_server.mcp, "call_tool", fake_call_tool)
+
+    await http_server.warm_up_tools()
+
+    assert called == [(name, {}) for name in http_server.WARMUP_TOOLS]
+    assert set(http_server.WARMUP_TOOLS) <= set(http_server._TOOL_CACHES)
+
+    print(f"✅ Warmed up {len(called)} tools")
+
+
+@pytest.mark.asyncio
+async def test_batch_tool(monkeypatch):
+    """
+    Test 13: Batch Tool
+    測試 batch 工具並行執行多個呼叫，並個別回傳結果或錯誤
+    """
+    print("\n" + "="*70)
+    print("Test 13: Batch Tool")
+    print("="*70)
+
+    import json
+
+    from mcp.server.fastmcp.tools import Tool
+
+    calls = []
+
+    async def lookup(number: str, testament: str = "NT", limit: int = 10) -> dict:
+        calls.append((number, testament, limit))
+        if number == "0":
+            raise ValueError("invalid number")
+        return {"number": number, "testament": testament, "limit": limit}
+
+    tool = Tool.from_function(
+        http_server._make_tool("fake_lookup", lookup), name="fake_lookup", structured_output=False
+    )
+    monkeypatch.setitem(http_server._BATCH_TOOLS, "fake_lookup", tool)
+
+    text = await http_server.batch([
+        http_server.BatchCall(name="fake_lookup", arguments={"number": "25"}),
+        http_server.BatchCall(name="fake_lookup", arguments={"number": "0"}),
+        http_server.BatchCall(name="fake_lookup", arguments={"num": "1"}),
+        http_server.BatchCall(name="missing_tool"),
+        http_server.BatchCall(name="fake_lookup", arguments={"number": "26", "limit": "3"}),
+        http_server.BatchCall(name="fake_lookup", arguments={"number": 27}),
+        http_server.BatchCall(name="fake_lookup", arguments={"number": "28", "limit": "many"}),
+    ])
+    results = json.loads(text)
+
+    assert results[0] == {
+        "name": "fake_lookup", "result": {"number": "25", "testament": "NT", "limit": 10}
+    }
+    assert results[1] == {"name": "fake_lookup", "error": "invalid number"}
+    assert results[2]["name"] == "fake_lookup" and "error" in results[2]
+    assert results[3] == {"name": "missing_tool", "error": "Unknown tool: missing_tool"}
+
+    # 參數與直接 tools/call 一樣經過驗證與轉型
+    assert results[4] == {
+        "name": "fake_lookup", "result": {"number": "26", "testament": "NT", "limit": 3}
+    }
+    assert results[5]["name"] == "fake_lookup" and "error" in results[5]
+    assert results[6]["name"] == "fake_lookup" and "error" in results[6]
+    assert [number for number, _, _ in calls] == ["25", "0", "26"]
+
+    with pytest.raises(ValueError):
+        await http_server.batch(
+            [http_server.BatchCall(name="fake_lookup")] * (http_server.BATCH_MAX_CALLS + 1)
+        )
+
+    print(f"✅ Batch results: {results}")
+
+
+@pytest.mark.asyncio
+async def test_tool_result_sent_once():
+    """
+    Test 14: Unstructured Tool Output
+    測試工具結果只以文字內容回傳，不重複放入 structuredContent
+    """
+    print("\n" + "="*70)
+    print("Test 14: Unstructured Tool Output")
+    print("="*70)
+
+    tools = await http_server.mcp.list_tools()
+    assert all(tool.outputSchema is None for tool in tools)
+
+    result = await http_server.mcp.call_tool("batch", {"calls": []})
+    assert [content.text for content in result] == ["[]"]
+
+    print("✅ Tool result returned as text content only")
+
+
+@pytest.mark.asyncio
+async def test_tools_list_result_cached():
+    """
+    Test 15: Cached tools/list
+    測試 tools/list 回應只建立一次，之後重複使用
+    """
+    print("\n" + "="*70)
+    print("Test 15: Cached tools/list")
+    print("="*70)
+
+    from mcp import types
+
+    handler = http_server.mcp._mcp_server.request_handlers[types.ListToolsRequest]
+    request = types.ListToolsRequest(method="tools/list")
+
+    first = await handler(request)
+    second = await handler(request)
+
+    assert second is first
+    names = [tool.name for tool in first.root.tools]
+    assert names == [name for name, _, _ in http_server.TOOLS] + ["batch"]
+    assert set(http_server.mcp._mcp_server._tool_cache) == set(names)
+
+    print(f"✅ tools/list result reused ({len(names)} tools)")
+
+
+@pytest.mark.asyncio
+async def test_make_tool_runs_sync_function_in_thread():
+    """
+    Test 16: Synchronous Implementation
+    測試同步實作函數在執行緒中執行，不阻塞事件迴圈
+    """
+    print("\n" + "="*70)
+    print("Test 16: Synchronous Implementation")
+    print("="*70)
+
+    import threading
+
+    threads = []
+
+    def lookup(book: str, chapter: int = 1) -> dict:
+        threads.append(threading.get_ident())
+        return {"book": book, "chapter": chapter}
+
+    tool = http_server._make_tool("sync_lookup", lookup)
+
+    assert list(inspect.signature(tool).parameters) == ["book", "chapter"]
+    assert await tool(book="約", chapter=3) == '{"book":"約","chapter":3}'
+    assert threads and threads[0] != threading.get_ident()
+
+    print("✅ Synchronous implementation ran in a worker thread")
+
+
+def test_gzip_large_json_responses(monkeypatch):
+    """
+    Test 17: GZip Compression
+    測試大於門檻的 JSON 回應會以 gzip 壓縮，小回應維持原樣
+    """
+    print("\n" + "="*70)
+    print("Test 17: GZip Compression")
+    print("="*70)
+
+    import orjson
+    from starlette.testclient import TestClient
+
+    card = {**http_server.SERVER_CARD, "padding": "太初有道，道與神同在，道就是神。" * 100}
+    monkeypatch.setattr(http_server, "_SERVER_CARD_BODY", orjson.dumps(card))
+
+    client = TestClient(http_server.create_http_app())
+    headers = {"Accept-Encoding": "gzip"}
+
+    response = client.get("/.well-known/mcp/server-card.json", headers=headers)
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(http_server._SERVER_CARD_BODY)
+    assert response.json() == card
+
+    response = client.get("/health", headers=headers)
+    assert "content-encoding" not in response.headers
+
+    print("✅ Large JSON responses compressed")
+
+
+@pytest.mark.asyncio
+async def test_mcp_endpoint_fast_path():
+    """
+    Test 18: MCP Endpoint Fast Path
+    測試 MCP 路徑直接交給 FastMCP 端點，其他請求與 lifespan 仍經過 Starlette
+    """
+    print("\n" + "="*70)
+    print("Test 18: MCP Endpoint Fast Path")
+    print("="*70)
+
+    handled = []
+
+    async def app(scope, receive, send):
+        handled.append(("app", scope["type"], scope.get("path")))
+
+    async def endpoint(scope, receive, send):
+        handled.append(("endpoint", scope["type"], scope.get("path")))
+
+    middleware = http_server.McpEndpointMiddleware(app, "/mcp", endpoint)
+    await middleware({"type": "http", "path": "/mcp"}, None, None)
+    await middleware({"type": "http", "path": "/health"}, None, None)
+    await middleware({"type": "http", "path": "/mcp/"}, None, None)
+    await middleware({"type": "lifespan"}, None, None)
+
+    assert handled == [
+        ("endpoint", "http", "/mcp"),
+        ("app", "http", "/health"),
+        ("app", "http", "/mcp/"),
+        ("app", "lifespan", None),
+    ]
+
+    print("✅ MCP requests bypass the Starlette router")
+
+
+@pytest.mark.asyncio
+async def test_root_to_mcp_rewrite():
+    """
+    Test 19: Root Path Rewrite
+    測試 "/" 的 MCP 請求改寫為 /mcp，其他請求維持原路徑
+    """
+    print("\n" + "="*70)
+    print("Test 19: Root Path Rewrite")
+    print("="*70)
+
+    paths = []
+
+    async def app(scope, receive, send):
+        paths.append(scope.get("path"))
+
+    middleware = http_server.RootToMcpMiddleware(app)
+    requests = [
+        {"type": "http", "method": "POST", "path": "/", "query_string": b""},
+        {"type": "http", "method": "GET", "path": "/", "query_string": b"use_simplified=true"},
+        {"type": "http", "method": "GET", "path": "/", "query_string": b""},
+        {"type": "http", "method": "POST", "path": "/health", "query_string": b""},
+        {"type": "lifespan"},
+    ]
+    for scope in requests:
+        await middleware(scope, None, None)
+
+    assert paths == ["/mcp", "/mcp", "/", "/health", None]
+    assert requests[0]["path"] == "/"  # 原 scope 不被修改
+
+    print("✅ Root MCP requests rewritten to /mcp")
+
+
+@pytest.mark.asyncio
+async def test_static_book_listings():
+    """
+    Test 20: Static Book Listings
+    測試次經 / 使徒教父書卷與文章專欄列表在模組載入時建立一次，書卷依 ID 排序
+    """
+    print("\n" + "="*70)
+    print("Test 20: Static Book Listings")
+    print("="*70)
+
+    from fhl_bible_mcp import http_tools
+    from fhl_bible_mcp.tools.apocrypha import APOCRYPHA_BOOKS
+
+    result = await http_tools.http_list_apocrypha_books()
+    books = result["books"]
+    assert result is http_tools._APOCRYPHA_BOOKS_RESPONSE
+    assert result["book_count"] == len({info["id"] for info in APOCRYPHA_BOOKS.values()})
+    assert [book["id"] for book in books] == sorted(book["id"] for book in books)
+    assert all(
+        APOCRYPHA_BOOKS[abbr]["id"] == book["id"]
+        for book in books
+        for abbr in book["abbreviations"]
+    )
+
+    result = await http_tools.http_list_apostolic_fathers_books()
+    assert result is await http_tools.http_list_apostolic_fathers_books()
+    assert http_tools._APOSTOLIC_FATHERS_BID_TO_NAME[201] == result["books"][0]["name_zh"]
+
+    # 搜尋結果的 bid 可能是字串或整數，未知的 bid 使用紀錄本身的書名
+    name = http_tools._APOCRYPHA_BID_TO_NAME[101]
+    format_record = http_tools._format_search_record
+    assert format_record({"bid": "101"}, http_tools._APOCRYPHA_BID_TO_NAME)["book"] == name
+    assert format_record({"bid": 101}, http_tools._APOCRYPHA_BID_TO_NAME)["book"] == name
+    assert format_record(
+        {"bid": "x", "chineses": "未知書卷"}, http_tools._APOCRYPHA_BID_TO_NAME
+    )["book"] == "未知書卷"
+
+    columns = await http_tools.http_list_article_columns()
+    assert columns["column_count"] == len(columns["columns"]) > 0
+
+    print(f"✅ {len(books)} apocrypha books, {result['book_count']} apostolic fathers books")
@@ -5,7 +5,7 @@ Tests for server initialization and component registration.
 """
 
 import pytest
-from fhl_bible_mcp.server import FHLBibleServer
+from fhl_bible_mcp.server import CACHEABLE_TOOLS, FHLBibleServer
 
 
 @pytest.mark.asyncio
@@ -216,6 +216,181 @@ async def test_component_integration():
     print(f"   - Supported resource types: {len(supported)}")
 
 
+@pytest.mark.asyncio
+async def test_tool_dispatch_tables():
+    """
+    Test 7: Tool Dispatch Tables
+    測試每個列出的工具都能由 call_tool 的分派表找到實作
+    """
+    print("\n" + "="*70)
+    print("Test 7: Tool Dispatch Tables")
+    print("="*70)
+    
+    server = FHLBibleServer()
+    
+    tool_names = {tool.name for tool in server.tools}
+    dispatch_names = set(server.tool_functions) | set(server.tool_handlers)
+    
+    assert not set(server.tool_functions) & set(server.tool_handlers), \
+        "A tool should be dispatched by only one table"
+    assert dispatch_names == tool_names, "Every listed tool should be dispatchable"
+    assert CACHEABLE_TOOLS <= set(server.tool_functions), \
+        "Cached tools should be keyword-argument functions"
+    assert FHLBibleServer().tools is server.tools, "Tool definitions should be shared"
+    
+    print(f"✅ {len(dispatch_names)} tools dispatched "
+          f"({len(server.tool_functions)} functions + {len(server.tool_handlers)} handlers)")
+
+
+@pytest.mark.asyncio
+async def test_cached_tool_results():
+    """
+    Test 8: Cached Tool Results
+    測試唯讀工具的 JSON 結果依參數快取，重複呼叫不再呼叫實作函數
+    """
+    print("\n" + "="*70)
+    print("Test 8: Cached Tool Results")
+    print("="*70)
+    
+    server = FHLBibleServer()
+    calls = []
+    
+    async def list_versions(use_simplified: bool = False) -> dict:
+        calls.append(use_simplified)
+        return {"versions": ["和合本"]}
+    
+    server.tool_functions["list_bible_versions"] = list_versions
+    
+    first = await server.call_cached("list_bible_versions")
+    second = await server.call_cached("list_bible_versions")
+    await server.call_cached("list_bible_versions", use_simplified=True)
+    
+    assert first == second
+    assert "和合本" in first
+    assert calls == [False, True], "Identical calls should be served from cache"
+    
+    print(f"✅ Cache info: {server.call_cached.cache.get_info()}")
+
+
+@pytest.mark.asyncio
+async def test_static_listings():
+    """
+    Test 9: Static Listings
+    測試 resources / prompts 列表在初始化時建立一次，與來源資料一致
+    """
+    print("\n" + "="*70)
+    print("Test 9: Static Listings")
+    print("="*70)
+    
+    server = FHLBibleServer()
+    
+    supported = server.resource_router.list_supported_resources()
+    assert len(server.resources) == sum(len(items) for items in supported.values())
+    assert all(resource["mimeType"] == "application/json" for resource in server.resources)
+    
+    prompt_names = [p["name"] for p in server.prompt_manager.list_prompts()]
+    assert [prompt.name for prompt in server.prompts] == prompt_names
+    
+    print(f"✅ {len(server.resources)} resources, {len(server.prompts)} prompts")
+
+
+@pytest.mark.asyncio
+async def test_run_uses_shared_pool(monkeypatch):
+    """
+    Test 10: Shared Connection Pool
+    測試 run() 期間 endpoints 與資源路由使用共用連線池，結束後關閉並移除
+    """
+    print("\n" + "="*70)
+    print("Test 10: Shared Connection Pool")
+    print("="*70)
+    
+    from contextlib import asynccontextmanager
+    
+    from fhl_bible_mcp import server as server_module
+    from fhl_bible_mcp.api.client import get_shared_http_client
+    from fhl_bible_mcp.api.endpoints import get_endpoints
+    
+    @asynccontextmanager
+    async def fake_stdio_server():
+        yield None, None
+    
+    server = FHLBibleServer()
+    initial_endpoints = server.endpoints
+    seen = {}
+    
+    async def fake_run(read_stream, write_stream, options):
+        pool = get_shared_http_client()
+        seen["pool"] = pool
+        assert server.endpoints is not initial_endpoints
+        assert server.endpoints._client is pool and not server.endpoints._owns_client
+        assert server.resource_router.endpoints is server.endpoints
+        assert get_endpoints() is server.endpoints
+    
+    monkeypatch.setattr(server_module, "stdio_server", fake_stdio_server)
+    monkeypatch.setattr(server.server, "run", fake_run)
+    
+    await server.run()
+    
+    assert initial_endpoints._client.is_closed
+    assert seen["pool"].is_closed
+    assert get_shared_http_client() is None
+    assert get_endpoints() is not server.endpoints
+    
+    print("✅ Endpoints rebuilt on the shared pool, pool closed on exit")
+
+
+@pytest.mark.asyncio
+async def test_smithery_pool_lifecycle():
+    """
+    Test 11: Smithery Connection Pool
+    測試 Smithery lifespan 讓同時進行的 session 共用連線池，最後一個 session 結束時關閉並移除；
+    其他入口預先安裝的連線池不被取代也不被關閉
+    """
+    print("\n" + "="*70)
+    print("Test 11: Smithery Connection Pool")
+    print("="*70)
+    
+    from fhl_bible_mcp.api.client import (
+        create_http_client,
+        get_shared_http_client,
+        set_shared_http_client,
+    )
+    from fhl_bible_mcp.smithery_server import _shared_http_pool
+    
+    assert get_shared_http_client() is None
+    
+    # 兩個重疊的 session 共用同一個連線池
+    first = _shared_http_pool(None)
+    second = _shared_http_pool(None)
+    await first.__aenter__()
+    pool = get_shared_http_client()
+    assert pool is not None
+    
+    await second.__aenter__()
+    assert get_shared_http_client() is pool
+    
+    await first.__aexit__(None, None, None)
+    assert get_shared_http_client() is pool and not pool.is_closed
+    
+    await second.__aexit__(None, None, None)
+    assert pool.is_closed
+    assert get_shared_http_client() is None
+    
+    # 其他入口預先安裝的連線池
+    external = create_http_client()
+    set_shared_http_client(external)
+    try:
+        async with _shared_http_pool(None):
+            assert get_shared_http_client() is external
+        assert get_shared_http_client() is external
+        assert not external.is_closed
+    finally:
+        set_shared_http_client(None)
+        await external.aclose()
+    
+    print("✅ Pool shared across sessions, closed after the last one")
+
+
 # ============================================================================
 # Test Runner
 # ============================================================================
@@ -236,6 +411,9 @@ if __name__ == "__main__":
             ("Prompts Registration", test_prompts_registered),
             ("Server Handlers", test_server_handlers),
             ("Component Integration", test_component_integration),
+            ("Tool Dispatch Tables", test_tool_dispatch_tables),
+            ("Cached Tool Results", test_cached_tool_results),
+            ("Static Listings", test_static_listings),
         ]
         
         passed = 0
@@ -0,0 +1,114 @@
+"""
+Test FHL Bible MCP Smithery Server
+
+Tests for the Smithery runtime: cached list and lookup tools.
+"""
+
+import orjson
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+from fhl_bible_mcp import http_tools, smithery_server
+
+
+async def _call_text(server, name: str, arguments: dict) -> str:
+    """Call a tool through an in-memory MCP session and return its text content."""
+    async with create_connected_server_and_client_session(server._mcp_server) as session:
+        result = await session.call_tool(name, arguments)
+    assert not result.isError, result.content[0].text
+    return result.content[0].text
+
+
+@pytest.mark.asyncio
+async def test_list_tools_cached(monkeypatch):
+    """
+    Test 1: Cached List Tools
+    測試次經、使徒教父、文章專欄列表工具可正常呼叫，且結果被快取
+    """
+    print("\n" + "="*70)
+    print("Test 1: Cached List Tools")
+    print("="*70)
+
+    server = smithery_server.create_server()
+    tools = [
+        ("list_apocrypha_books_tool", "http_list_apocrypha_books"),
+        ("list_apostolic_fathers_books_tool", "http_list_apostolic_fathers_books"),
+        ("list_fhl_article_columns_tool", "http_list_article_columns"),
+    ]
+
+    # 實際的 kwargs 版本（靜態資料，不需連線）
+    for tool_name, backend_name in tools:
+        smithery_server._list_json.cache.clear()
+        text = await _call_text(server, tool_name, {})
+        assert orjson.loads(text) == await getattr(http_tools, backend_name)()
+
+    # 模擬後端：相同呼叫只執行一次
+    for tool_name, backend_name in tools:
+        calls = []
+
+        async def backend(name=backend_name):
+            calls.append(name)
+            return {"status": "success", "backend": name}
+
+        monkeypatch.setattr(smithery_server, backend_name, backend)
+        smithery_server._list_json.cache.clear()
+
+        for _ in range(2):
+            text = await _call_text(server, tool_name, {})
+            assert orjson.loads(text) == {"status": "success", "backend": backend_name}
+        assert calls == [backend_name]
+
+    print("✅ List tools return their data and are served from cache")
+
+
+@pytest.mark.asyncio
+async def test_lookup_tools_cached(monkeypatch):
+    """
+    Test 2: Cached Lookup Tools
+    測試次經、使徒教父經文與註腳查詢工具可正常呼叫，且相同參數只查詢一次
+    """
+    print("\n" + "="*70)
+    print("Test 2: Cached Lookup Tools")
+    print("="*70)
+
+    calls = []
+    record = {"bid": 101, "sec": 1, "bible_text": "太初有道", "id": 1, "text": "註腳"}
+
+    class FakeEndpoints:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return None
+
+        async def _respond(self, name, **kwargs):
+            calls.append((name, kwargs))
+            return {"status": "success", "record_count": 1, "record": [record]}
+
+        async def get_apocrypha_verse(self, **kwargs):
+            return await self._respond("get_apocrypha_verse", **kwargs)
+
+        async def get_apostolic_fathers_verse(self, **kwargs):
+            return await self._respond("get_apostolic_fathers_verse", **kwargs)
+
+        async def get_footnote(self, **kwargs):
+            return await self._respond("get_footnote", **kwargs)
+
+    monkeypatch.setattr(http_tools, "get_endpoints", FakeEndpoints)
+    smithery_server._lookup_json.cache.clear()
+    server = smithery_server.create_server()
+
+    requests = [
+        ("get_apocrypha_verse_tool", {"book": "多", "chapter": 1, "verse": "1"}),
+        ("get_apostolic_fathers_verse_tool", {"book": "革", "chapter": 1, "verse": "1"}),
+        ("get_bible_footnote_tool", {"book_id": 1, "footnote_id": 1}),
+    ]
+    for tool_name, arguments in requests:
+        for _ in range(2):
+            result = orjson.loads(await _call_text(server, tool_name, arguments))
+            assert result["status"] == "success"
+
+    assert [name for name, _ in calls] == [
+        "get_apocrypha_verse", "get_apostolic_fathers_verse", "get_footnote"
+    ]
+
+    print("✅ Lookup tools return their data and are served from cache")
@@ -408,6 +408,34 @@ def test_case_insensitive_english():
     print("✅ Case insensitive English works")
 
 
+def test_normalize_book_name_cached():
+    """
+    Test 13: 書卷名稱標準化快取
+    測試重複標準化同一名稱時使用快取，結果保持一致
+    """
+    print("\n" + "="*70)
+    print("Test 13: Normalize Book Name Cache")
+    print("="*70)
+    
+    BookNameConverter.normalize_book_name.cache_clear()
+    
+    assert BookNameConverter.normalize_book_name("约翰福音") == "約"
+    assert BookNameConverter.normalize_book_name("约翰福音") == "約"
+    assert BookNameConverter.normalize_book_name("不存在") is None
+    
+    info = BookNameConverter.normalize_book_name.cache_info()
+    assert info.hits == 1
+    
+    # 英文名稱不分大小寫，且能對應到書卷編號
+    for book in BookNameConverter.get_all_books():
+        for key in ("eng_short", "eng_full"):
+            assert BookNameConverter.get_book_id(book[key]) == book["id"]
+            assert BookNameConverter.get_book_id(book[key].upper()) == book["id"]
+        assert BookNameConverter.get_book_id(book["chi_full"]) == book["id"]
+    
+    print(f"✅ Cache info: {info}")
+
+
 # ============================================================================
 # Test Runner
 # ============================================================================
@@ -431,6 +459,7 @@ if __name__ == "__main__":
         ("All Books List", test_all_books_list),
         ("Edge Cases", test_edge_cases),
         ("Case Insensitive", test_case_insensitive_english),
+        ("Normalize Cache", test_normalize_book_name_cached),
     ]
     
     passed = 0
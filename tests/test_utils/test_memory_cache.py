@@ -0,0 +1,250 @@
+"""
+Test Memory Cache
+
+Tests for the in-process MemoryCache, memory_cached and single_flight decorators.
+"""
+
+import asyncio
+
+import pytest
+from fhl_bible_mcp.utils import cache as cache_module
+from fhl_bible_mcp.utils.cache import (
+    MemoryCache,
+    list_cached,
+    lookup_cached,
+    memory_cached,
+    single_flight,
+)
+
+
+def test_memory_cache_basic():
+    """
+    Test 1: 基本操作
+    測試 set / get 與統計資訊
+    """
+    print("\n" + "="*70)
+    print("Test 1: Memory Cache Basic Operations")
+    print("="*70)
+
+    cache = MemoryCache(maxsize=10)
+    cache.set("a", {"text": "太初有道"})
+
+    assert cache.get("a") == {"text": "太初有道"}
+    assert cache.get("missing") is None
+    assert cache.get("missing", "default") == "default"
+
+    info = cache.get_info()
+    assert info["size"] == 1
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+
+    print(f"✅ Cache info: {info}")
+
+
+def test_memory_cache_lru_eviction():
+    """
+    Test 2: LRU 淘汰
+    測試超過 maxsize 時淘汰最久未使用的項目
+    """
+    print("\n" + "="*70)
+    print("Test 2: Memory Cache LRU Eviction")
+    print("="*70)
+
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a 變成最近使用
+    cache.set("c", 3)  # 淘汰 b
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    print("✅ Least recently used entry evicted")
+
+
+def test_memory_cache_ttl(monkeypatch):
+    """
+    Test 3: TTL 過期
+    測試超過 ttl_seconds 的項目會失效
+    """
+    print("\n" + "="*70)
+    print("Test 3: Memory Cache TTL")
+    print("="*70)
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    cache = MemoryCache(maxsize=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    now[0] += 59
+    assert cache.get("a") == 1
+
+    now[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+    print("✅ Expired entry removed")
+
+
+@pytest.mark.asyncio
+async def test_memory_cached_decorator():
+    """
+    Test 4: memory_cached 裝飾器
+    測試相同參數只呼叫一次原函數，且例外不會被快取
+    """
+    print("\n" + "="*70)
+    print("Test 4: memory_cached Decorator")
+    print("="*70)
+
+    calls = []
+
+    @memory_cached(maxsize=10, ttl_seconds=60)
+    async def lookup(book: str, chapter: int, fail: bool = False):
+        calls.append((book, chapter, fail))
+        if fail:
+            raise ValueError("upstream error")
+        return {"book": book, "chapter": chapter}
+
+    assert await lookup("約", 3) == {"book": "約", "chapter": 3}
+    assert await lookup("約", 3) == {"book": "約", "chapter": 3}
+    assert await lookup(book="約", chapter=3) == {"book": "約", "chapter": 3}
+    assert len(calls) == 2  # 位置參數與關鍵字參數各算一次
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await lookup("約", 3, fail=True)
+    assert len(calls) == 4  # 例外不快取
+
+    assert lookup.__name__ == "lookup"
+    print(f"✅ Cache info: {lookup.cache.get_info()}")
+
+
+@pytest.mark.asyncio
+async def test_memory_cached_unhashable_arguments():
+    """
+    Test 5: 無法雜湊的參數
+    測試參數無法雜湊時直接呼叫原函數
+    """
+    print("\n" + "="*70)
+    print("Test 5: memory_cached Unhashable Arguments")
+    print("="*70)
+
+    calls = []
+
+    @memory_cached(maxsize=10)
+    async def echo(items):
+        calls.append(items)
+        return items
+
+    assert await echo([1, 2]) == [1, 2]
+    assert await echo([1, 2]) == [1, 2]
+    assert len(calls) == 2
+    assert len(echo.cache) == 0
+
+    print("✅ Unhashable arguments bypass the cache")
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    """
+    Test 6: single_flight 裝飾器
+    測試同時進行中的相同呼叫只執行一次，完成後不保留結果
+    """
+    print("\n" + "="*70)
+    print("Test 6: single_flight Decorator")
+    print("="*70)
+
+    calls = []
+    release = asyncio.Event()
+
+    @single_flight
+    async def lookup(book: str, chapter: int):
+        calls.append((book, chapter))
+        await release.wait()
+        return {"book": book, "chapter": chapter}
+
+    pending = [
+        asyncio.create_task(lookup("約", 3)),
+        asyncio.create_task(lookup("約", 3)),
+        asyncio.create_task(lookup("約", 4)),
+    ]
+    await asyncio.sleep(0)
+    assert len(lookup.inflight) == 2
+
+    # 取消其中一個等待者不影響共用的呼叫
+    pending[1].cancel()
+    release.set()
+    first, second, third = await asyncio.gather(*pending, return_exceptions=True)
+
+    assert first == {"book": "約", "chapter": 3}
+    assert isinstance(second, asyncio.CancelledError)
+    assert third == {"book": "約", "chapter": 4}
+    assert len(calls) == 2
+    assert len(lookup.inflight) == 0
+
+    # 完成後的呼叫重新執行
+    assert await lookup("約", 3) == {"book": "約", "chapter": 3}
+    assert len(calls) == 3
+
+    print("✅ Concurrent identical calls shared one execution")
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_exception():
+    """
+    Test 7: single_flight 例外
+    測試進行中呼叫的例外會傳給所有等待者
+    """
+    print("\n" + "="*70)
+    print("Test 7: single_flight Exception")
+    print("="*70)
+
+    calls = []
+
+    @single_flight
+    async def fail(book: str):
+        calls.append(book)
+        await asyncio.sleep(0)
+        raise ValueError("upstream error")
+
+    results = await asyncio.gather(fail("約"), fail("約"), return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(calls) == 1
+    assert len(fail.inflight) == 0
+
+    print("✅ Exception delivered to every waiter")
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_settings():
+    """
+    Test 8: 共用快取設定
+    測試 lookup_cached / list_cached 的參數，且每個函數各自擁有快取
+    """
+    print("\n" + "="*70)
+    print("Test 8: Shared Cache Settings")
+    print("="*70)
+
+    async def verse(book: str):
+        return {"book": book}
+
+    async def chapter(book: str):
+        return {"book": book}
+
+    cached_verse = lookup_cached(verse)
+    cached_chapter = lookup_cached(chapter)
+    cached_list = list_cached(verse)
+
+    assert (cached_verse.cache.maxsize, cached_verse.cache.ttl_seconds) == (4096, 3600)
+    assert (cached_list.cache.maxsize, cached_list.cache.ttl_seconds) == (64, 86400)
+
+    await cached_verse("約")
+    assert len(cached_verse.cache) == 1
+    assert len(cached_chapter.cache) == 0
+    assert cached_verse.cache is not cached_chapter.cache
+
+    print("✅ Shared settings, separate caches")
@@ -0,0 +1,92 @@
+"""
+Test JSON Serialization
+
+Tests for the orjson-based to_json / to_compact_json helpers.
+"""
+
+import json
+
+from fhl_bible_mcp.utils.serialization import to_compact_json, to_json
+
+
+def test_to_json_matches_stdlib():
+    """
+    Test 1: 與標準庫輸出一致
+    測試 to_json 與 json.dumps(ensure_ascii=False) 的縮排 / 精簡輸出相同
+    """
+    print("\n" + "="*70)
+    print("Test 1: to_json Matches json.dumps")
+    print("="*70)
+
+    data = {
+        "book": "約翰福音",
+        "verses": [{"verse": 16, "text": "神愛世人，甚至將他的獨生子賜給他們"}],
+        "strongs": {"G25": "ἀγαπάω"},
+        "empty": {},
+        "items": [],
+        "total": 1.5,
+        "found": True,
+        "note": None,
+    }
+
+    assert to_json(data, indent=True) == json.dumps(data, ensure_ascii=False, indent=2)
+    assert to_json(data, indent=False) == json.dumps(
+        data, ensure_ascii=False, separators=(",", ":")
+    )
+
+    print("✅ Output identical to json.dumps")
+
+
+def test_to_json_non_string_keys():
+    """
+    Test 2: 非字串鍵
+    測試 int 鍵與標準庫一樣轉為字串
+    """
+    print("\n" + "="*70)
+    print("Test 2: to_json Non-String Keys")
+    print("="*70)
+
+    data = {1: "創世記", 2: "出埃及記"}
+
+    assert to_json(data, indent=True) == json.dumps(data, ensure_ascii=False, indent=2)
+
+    print("✅ Integer keys serialized as strings")
+
+
+def test_to_compact_json():
+    """
+    Test 3: 精簡輸出
+    測試 to_compact_json 輸出無空白且保留中文字元
+    """
+    print("\n" + "="*70)
+    print("Test 3: to_compact_json")
+    print("="*70)
+
+    data = {"book": "約", "chapter": 3, "verses": [16, 17]}
+
+    assert to_compact_json(data) == '{"book":"約","chapter":3,"verses":[16,17]}'
+    assert json.loads(to_compact_json(data)) == data
+
+    print("✅ Compact JSON output")
+
+
+def test_to_json_default_indent(monkeypatch):
+    """
+    Test 4: 預設縮排設定
+    測試 to_json 預設依 FHL_JSON_INDENT 設定（預設精簡輸出）
+    """
+    print("\n" + "="*70)
+    print("Test 4: to_json Default Indent")
+    print("="*70)
+
+    from fhl_bible_mcp.utils import serialization
+
+    data = {"book": "約"}
+
+    monkeypatch.setattr(serialization, "JSON_INDENT", False)
+    assert to_json(data) == '{"book":"約"}'
+
+    monkeypatch.setattr(serialization, "JSON_INDENT", True)
+    assert to_json(data) == '{\n  "book": "約"\n}'
+
+    print("✅ Default follows FHL_JSON_INDENT")